@@ -2,7 +2,6 @@
 
 import uvicorn
 
-from orchestrator.api.main import create_app
 from orchestrator.config import get_settings
 
 
@@ -10,13 +9,16 @@ def main():
     """Run the API server."""
     settings = get_settings()
 
-    app = create_app()
-
+    # Reload and multiple workers both need an import string so that each
+    # process can build its own app; reload only supports a single worker.
     uvicorn.run(
-        app,
+        "orchestrator.api.main:create_app",
+        factory=True,
         host=settings.api_host,
         port=settings.api_port,
         reload=settings.api_reload,
+        workers=1 if settings.api_reload else settings.api_workers,
+        access_log=settings.api_access_log,
     )
 
 
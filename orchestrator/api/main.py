@@ -5,7 +5,9 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from orchestrator.api.routes import router, _es_client_instance
+from orchestrator.api.routes import router
+from orchestrator.config import get_settings
+from orchestrator.core import close_global_client, get_global_client
 
 
 @asynccontextmanager
@@ -13,20 +15,30 @@ async def lifespan(app: FastAPI):
     """Lifespan context manager for startup/shutdown events."""
     # Startup
     print("Starting Query Orchestrator API...")
+    try:
+        # Open the connection pool before the first request arrives
+        await get_global_client(get_settings())
+    except Exception as e:
+        print(f"ElasticSearch not reachable at startup: {e}")
     yield
     # Shutdown
     print("Shutting down Query Orchestrator API...")
-    if _es_client_instance:
-        await _es_client_instance.disconnect()
+    await close_global_client()
 
 
 def create_app() -> FastAPI:
     """Create and configure FastAPI application."""
+    settings = get_settings()
+
+    # The OpenAPI schema and interactive docs are only served outside production
     app = FastAPI(
         title="Query Orchestrator",
         description="Internal tool for Search team query orchestration",
         version="0.1.0",
         lifespan=lifespan,
+        openapi_url=None if settings.production else "/openapi.json",
+        docs_url=None if settings.production else "/docs",
+        redoc_url=None if settings.production else "/redoc",
     )
 
     # Add CORS middleware
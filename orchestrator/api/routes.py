@@ -1,37 +1,56 @@
 """API route handlers."""
 
-import json
+import asyncio
+import hashlib
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple
 
-from fastapi import APIRouter, HTTPException, Depends
+import orjson
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
+from fastapi.exceptions import RequestValidationError
 from elasticsearch import AsyncElasticsearch
+from pydantic import ValidationError
 
 from orchestrator import __version__
-from orchestrator.config import AlgorithmConfig, Settings, get_settings
-from orchestrator.core import ElasticsearchClient, BlockFactory, AlgorithmExecutor
+from orchestrator.config import (
+    AlgorithmConfig,
+    Settings,
+    get_settings,
+)
+from orchestrator.core import (
+    ElasticsearchClient,
+    BlockFactory,
+    AlgorithmExecutor,
+    get_global_client,
+)
+from orchestrator.core.executor import ExecutionResult
 from orchestrator.api.models import (
     SearchRequest,
     SearchResponse,
     CompareRequest,
     CompareResponse,
     HealthResponse,
-    SearchHit,
 )
+from orchestrator.api.responses import ORJSONResponse
 
 router = APIRouter()
 
-# Dependency to get ES client
-_es_client_instance = None
+# Parsed algorithm configs keyed by ID, with the file mtime they were loaded at
+_algorithm_cache: Dict[str, Tuple[int, AlgorithmConfig]] = {}
+
+# Last /algorithms listing and the ETag of the config files it was built from
+_algorithm_list_cache: Optional[Tuple[str, List[AlgorithmConfig]]] = None
+
+# Executors keyed by (id of the ES client, index name)
+_executor_cache: Dict[Tuple[int, str], AlgorithmExecutor] = {}
+
+# Upper bound on cached executors; the index name comes from the request body
+MAX_CACHED_EXECUTORS = 64
 
 
 async def get_es_client(settings: Settings = Depends(get_settings)) -> ElasticsearchClient:
-    """Get or create ElasticSearch client."""
-    global _es_client_instance
-    if _es_client_instance is None:
-        _es_client_instance = ElasticsearchClient(settings)
-        await _es_client_instance.connect()
-    return _es_client_instance
+    """Get the process-wide ElasticSearch client."""
+    return await get_global_client(settings)
 
 
 @router.get("/health", response_model=HealthResponse)
@@ -39,7 +58,7 @@ async def health_check(
     es_client: ElasticsearchClient = Depends(get_es_client),
 ) -> HealthResponse:
     """Check API and ElasticSearch health."""
-    es_healthy = await es_client.health_check()
+    es_healthy, _ = await es_client.health_check()
 
     return HealthResponse(
         status="healthy" if es_healthy else "degraded",
@@ -48,115 +67,94 @@ async def health_check(
     )
 
 
-@router.post("/search", response_model=SearchResponse)
+@router.post(
+    "/search",
+    response_class=ORJSONResponse,
+    responses={200: {"model": SearchResponse}},
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": SearchRequest.model_json_schema()}},
+        }
+    },
+)
 async def search(
-    request: SearchRequest,
+    request: Request,
     settings: Settings = Depends(get_settings),
     es_client: ElasticsearchClient = Depends(get_es_client),
-) -> SearchResponse:
+) -> ORJSONResponse:
     """
     Execute a search algorithm.
 
     Either provide algorithm_id to load a saved algorithm,
     or provide algorithm_config to execute an inline algorithm.
     """
-    # Get algorithm configuration
-    if request.algorithm_config:
-        # Use inline algorithm config
-        try:
-            algorithm = AlgorithmConfig(**request.algorithm_config)
-        except Exception as e:
-            raise HTTPException(status_code=400, detail=f"Invalid algorithm config: {e}")
-
-    elif request.algorithm_id:
-        # Load algorithm from storage
-        algorithm = await load_algorithm(request.algorithm_id, settings)
-        if algorithm is None:
-            raise HTTPException(
-                status_code=404, detail=f"Algorithm not found: {request.algorithm_id}"
-            )
-    else:
-        raise HTTPException(
-            status_code=400,
-            detail="Either algorithm_id or algorithm_config must be provided",
-        )
-
-    # Get index name
-    index = request.index or f"{settings.elasticsearch_index_prefix}products"
-
-    # Create executor
-    client = await es_client.get_client()
-    factory = BlockFactory(client, index)
-    executor = AlgorithmExecutor(factory)
-
-    # Execute algorithm
+    # Parse and validate the raw body in one pass instead of json.loads + validate
     try:
-        if request.parallel:
-            result = await executor.execute_parallel_searches(
-                algorithm=algorithm,
-                query=request.query,
-                query_vector=request.query_vector,
-                context=request.context,
-            )
-        else:
-            result = await executor.execute(
-                algorithm=algorithm,
-                query=request.query,
-                query_vector=request.query_vector,
-                context=request.context,
-            )
-
-        # Convert to response
-        return SearchResponse(
-            algorithm_id=result.algorithm_id,
-            query=result.query,
-            hits=[
-                SearchHit(
-                    id=hit.id,
-                    score=hit.score,
-                    rank=hit.rank,
-                    source=hit.source,
-                )
-                for hit in result.final_result.hits
-            ],
-            total=result.final_result.total,
-            took_ms=result.total_time_ms,
-            metadata=result.metadata,
+        search_request = SearchRequest.model_validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
         )
 
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Search execution failed: {e}")
+    result = await _execute_search(search_request, settings, es_client)
+    return ORJSONResponse(_search_payload(result))
 
 
-@router.post("/compare", response_model=CompareResponse)
+@router.post(
+    "/compare",
+    response_class=ORJSONResponse,
+    responses={200: {"model": CompareResponse}},
+)
 async def compare_algorithms(
     request: CompareRequest,
     settings: Settings = Depends(get_settings),
     es_client: ElasticsearchClient = Depends(get_es_client),
-) -> CompareResponse:
+) -> ORJSONResponse:
     """
     Compare multiple algorithms side-by-side.
 
     Executes the same query against multiple algorithms and returns all results.
     """
-    results = []
+    outcomes: List[Any] = [None] * len(request.algorithm_ids)
 
-    for algorithm_id in request.algorithm_ids:
-        # Create search request for this algorithm
-        search_req = SearchRequest(
+    # Load every algorithm first so their searches can share one _msearch
+    loaded = await asyncio.gather(
+        *(load_algorithm(algorithm_id, settings) for algorithm_id in request.algorithm_ids)
+    )
+    positions = []
+    algorithms = []
+    for position, (algorithm_id, algorithm) in enumerate(zip(request.algorithm_ids, loaded)):
+        if algorithm is None:
+            outcomes[position] = HTTPException(
+                status_code=404, detail=f"Algorithm not found: {algorithm_id}"
+            )
+        else:
+            positions.append(position)
+            algorithms.append(algorithm)
+
+    if algorithms:
+        executor = await _get_executor(
+            es_client,
+            settings,
+            request.index or f"{settings.elasticsearch_index_prefix}products",
+        )
+        batch = await executor.execute_batch(
+            algorithms=algorithms,
             query=request.query,
-            algorithm_id=algorithm_id,
             query_vector=request.query_vector,
             context=request.context,
-            index=request.index,
         )
+        for position, outcome in zip(positions, batch):
+            outcomes[position] = outcome
 
-        try:
-            result = await search(search_req, settings, es_client)
-            results.append(result)
-        except Exception as e:
+    results = []
+    for algorithm_id, outcome in zip(request.algorithm_ids, outcomes):
+        if isinstance(outcome, Exception):
             # Log error but continue with other algorithms
-            print(f"Error executing algorithm {algorithm_id}: {e}")
+            print(f"Error executing algorithm {algorithm_id}: {outcome}")
+        else:
+            results.append(_search_payload(outcome))
 
     if not results:
         raise HTTPException(
@@ -164,35 +162,56 @@ async def compare_algorithms(
             detail="All algorithms failed to execute",
         )
 
-    return CompareResponse(
-        query=request.query,
-        results=results,
-        comparison_metadata={
-            "num_algorithms": len(request.algorithm_ids),
-            "successful": len(results),
-            "failed": len(request.algorithm_ids) - len(results),
-        },
+    return ORJSONResponse(
+        {
+            "query": request.query,
+            "results": results,
+            "comparison_metadata": {
+                "num_algorithms": len(request.algorithm_ids),
+                "successful": len(results),
+                "failed": len(request.algorithm_ids) - len(results),
+            },
+        }
     )
 
 
 @router.get("/algorithms", response_model=List[AlgorithmConfig])
 async def list_algorithms(
+    request: Request,
+    response: Response,
     settings: Settings = Depends(get_settings),
 ) -> List[AlgorithmConfig]:
-    """List all available algorithms."""
+    """
+    List all available algorithms.
+
+    Responds with an ETag derived from the config files, and with 304 Not
+    Modified when the client's If-None-Match still matches it.
+    """
+    global _algorithm_list_cache
     algorithms = []
 
     if settings.algorithm_storage_type == "filesystem":
         config_path = Path(settings.algorithm_config_path)
         if config_path.exists():
-            for config_file in config_path.glob("*.json"):
+            config_files = sorted(config_path.glob("*.json"))
+            etag = _config_files_etag(config_files)
+
+            if _etag_matches(request.headers.get("if-none-match", ""), etag):
+                return Response(status_code=304, headers={"ETag": etag})
+            response.headers["ETag"] = etag
+
+            # Reuse the last listing if no config file changed since
+            if _algorithm_list_cache is not None and _algorithm_list_cache[0] == etag:
+                return _algorithm_list_cache[1]
+
+            for config_file in config_files:
                 try:
-                    with open(config_file) as f:
-                        config = json.load(f)
-                        algorithms.append(AlgorithmConfig(**config))
+                    algorithms.append(AlgorithmConfig.model_validate_json(config_file.read_bytes()))
                 except Exception as e:
                     print(f"Error loading algorithm from {config_file}: {e}")
 
+            _algorithm_list_cache = (etag, algorithms)
+
     return algorithms
 
 
@@ -231,8 +250,14 @@ async def save_algorithm(
                 detail=f"Algorithm already exists: {algorithm.algorithm_id}",
             )
 
-        with open(file_path, "w") as f:
-            json.dump(algorithm.model_dump(), f, indent=2, default=str)
+        file_path.write_bytes(
+            orjson.dumps(
+                algorithm.model_dump(),
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+                default=str,
+            )
+        )
+        _algorithm_cache.pop(algorithm.algorithm_id, None)
 
     return algorithm
 
@@ -245,15 +270,129 @@ async def load_algorithm(
         config_path = Path(settings.algorithm_config_path)
         file_path = config_path / f"{algorithm_id}.json"
 
-        if not file_path.exists():
+        try:
+            mtime_ns = file_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            _algorithm_cache.pop(algorithm_id, None)
             return None
 
+        # Reuse the parsed config until the file changes on disk
+        cached = _algorithm_cache.get(algorithm_id)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
         try:
-            with open(file_path) as f:
-                config = json.load(f)
-                return AlgorithmConfig(**config)
+            algorithm = AlgorithmConfig.model_validate_json(file_path.read_bytes())
         except Exception as e:
             print(f"Error loading algorithm {algorithm_id}: {e}")
             return None
 
+        _algorithm_cache[algorithm_id] = (mtime_ns, algorithm)
+        return algorithm
+
     return None
+
+
+async def _execute_search(
+    request: SearchRequest,
+    settings: Settings,
+    es_client: ElasticsearchClient,
+) -> ExecutionResult:
+    """Resolve the requested algorithm and execute it."""
+    # Get algorithm configuration
+    if request.algorithm_config:
+        # Use inline algorithm config
+        try:
+            algorithm = AlgorithmConfig.model_validate(request.algorithm_config)
+        except Exception as e:
+            raise HTTPException(status_code=400, detail=f"Invalid algorithm config: {e}")
+
+    elif request.algorithm_id:
+        # Load algorithm from storage
+        algorithm = await load_algorithm(request.algorithm_id, settings)
+        if algorithm is None:
+            raise HTTPException(
+                status_code=404, detail=f"Algorithm not found: {request.algorithm_id}"
+            )
+    else:
+        raise HTTPException(
+            status_code=400,
+            detail="Either algorithm_id or algorithm_config must be provided",
+        )
+
+    # Get index name
+    index = request.index or f"{settings.elasticsearch_index_prefix}products"
+
+    executor = await _get_executor(es_client, settings, index)
+
+    # Execute algorithm
+    try:
+        if request.parallel:
+            return await executor.execute_parallel_searches(
+                algorithm=algorithm,
+                query=request.query,
+                query_vector=request.query_vector,
+                context=request.context,
+            )
+        return await executor.execute(
+            algorithm=algorithm,
+            query=request.query,
+            query_vector=request.query_vector,
+            context=request.context,
+        )
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Search execution failed: {e}")
+
+
+async def _get_executor(
+    es_client: ElasticsearchClient, settings: Settings, index: str
+) -> AlgorithmExecutor:
+    """Get the executor for an index, reusing it for the life of the process."""
+    client = await es_client.get_client()
+    key = (id(client), index)
+    executor = _executor_cache.get(key)
+    # A closed client's id can be reused by its replacement, so check identity
+    if executor is None or executor.block_factory.es_client is not client:
+        # Callers choose the index, so start over rather than grow forever
+        if key not in _executor_cache and len(_executor_cache) >= MAX_CACHED_EXECUTORS:
+            _executor_cache.clear()
+        executor = _executor_cache[key] = AlgorithmExecutor(
+            BlockFactory(client, index),
+            fuse_hybrid_rrf=settings.elasticsearch_rrf_retriever,
+        )
+    return executor
+
+
+def _search_payload(result: ExecutionResult) -> Dict[str, Any]:
+    """Build the SearchResponse body directly, skipping model validation."""
+    return {
+        "algorithm_id": result.algorithm_id,
+        "query": result.query,
+        "hits": [hit._asdict() for hit in result.final_result.hits],
+        "total": result.final_result.total,
+        "took_ms": result.total_time_ms,
+        "metadata": result.metadata,
+    }
+
+
+def _config_files_etag(config_files: List[Path]) -> str:
+    """Fingerprint config files by name and modification time."""
+    digest = hashlib.blake2b(digest_size=16)
+    for config_file in config_files:
+        try:
+            mtime_ns = config_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            # Deleted since the directory was listed
+            continue
+        digest.update(f"{config_file.name}:{mtime_ns};".encode())
+    return f'"{digest.hexdigest()}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag, using weak comparison."""
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
@@ -1,6 +1,7 @@
 """Composable building blocks for search algorithms."""
 
-from .base import Block, BlockResult
+from .base import Block, SearchBlock
+from .types import BlockResult, SearchResult
 from .keyword import KeywordSearchBlock
 from .vector import VectorSearchBlock
 from .merge import MergeBlock
@@ -9,6 +10,8 @@ from .rerank import RerankBlock
 __all__ = [
     "Block",
     "BlockResult",
+    "SearchBlock",
+    "SearchResult",
     "KeywordSearchBlock",
     "VectorSearchBlock",
     "MergeBlock",
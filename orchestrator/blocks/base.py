@@ -1,33 +1,19 @@
 """Base classes for composable blocks."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+import time
 
-from pydantic import BaseModel
+from elasticsearch import AsyncElasticsearch
 
-
-class SearchResult(BaseModel):
-    """A single search result."""
-
-    id: str
-    score: float
-    source: Dict[str, Any]
-    index: Optional[str] = None
-    rank: Optional[int] = None
-
-
-class BlockResult(BaseModel):
-    """Result from executing a block."""
-
-    hits: List[SearchResult]
-    total: int
-    took_ms: Optional[float] = None
-    metadata: Dict[str, Any] = {}
+from .types import BlockResult, SearchResult
 
 
 class Block(ABC):
     """Base class for all composable blocks."""
 
+    __slots__ = ("config",)
+
     def __init__(self, config: Dict[str, Any]):
         """Initialize block with configuration."""
         self.config = config
@@ -57,3 +43,105 @@ class Block(ABC):
     def validate_config(self) -> bool:
         """Validate the block configuration."""
         return True
+
+
+class SearchBlock(Block):
+    """
+    Base class for blocks backed by a single ElasticSearch search request.
+
+    Splitting request building from response parsing lets the executor batch
+    several search blocks into one _msearch round-trip.
+    """
+
+    __slots__ = ("es_client", "index")
+
+    def __init__(self, config: Dict[str, Any], es_client: AsyncElasticsearch, index: str):
+        """
+        Initialize search block.
+
+        Args:
+            config: Block configuration dictionary
+            es_client: ElasticSearch async client
+            index: Index name to search
+        """
+        super().__init__(config)
+        self.es_client = es_client
+        self.index = index
+
+    @abstractmethod
+    def build_body(
+        self,
+        query: str,
+        query_vector: Optional[List[float]] = None,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Build the ElasticSearch request body without executing it.
+
+        Args:
+            query: The user's search query text
+            query_vector: Optional pre-computed query embedding
+            context: Additional context (user_id, filters, etc.)
+
+        Returns:
+            Search request body
+        """
+        pass
+
+    @abstractmethod
+    def parse_response(
+        self, response: Dict[str, Any], query: str, took_ms: float
+    ) -> BlockResult:
+        """
+        Build a BlockResult from an ElasticSearch search response.
+
+        Args:
+            response: Search response (or one entry of an _msearch response)
+            query: The user's search query text
+            took_ms: Client-side time spent on the request
+
+        Returns:
+            BlockResult containing search hits
+        """
+        pass
+
+    @staticmethod
+    def _parse_hits(response: Dict[str, Any]) -> Tuple[List[SearchResult], int]:
+        """
+        Parse the hits and total hit count of an ElasticSearch search response.
+
+        Args:
+            response: Search response (or one entry of an _msearch response)
+
+        Returns:
+            Ranked hits and the total number of matching documents
+        """
+        response_hits = response["hits"]
+
+        # Parse results (positional args: id, score, source, index, rank)
+        hits = [
+            SearchResult(hit["_id"], hit["_score"], hit["_source"], hit["_index"], rank)
+            for rank, hit in enumerate(response_hits["hits"], start=1)
+        ]
+
+        # "total" is omitted when the request disables total hit tracking
+        total = response_hits.get("total")
+
+        return hits, total["value"] if total else len(hits)
+
+    async def execute(
+        self,
+        query: str,
+        query_vector: Optional[List[float]] = None,
+        context: Optional[Dict[str, Any]] = None,
+        previous_results: Optional[List[BlockResult]] = None,
+    ) -> BlockResult:
+        """Execute the search as a standalone request."""
+        start_ns = time.perf_counter_ns()
+
+        body = self.build_body(query, query_vector, context)
+        response = await self.es_client.search(index=self.index, body=body)
+
+        elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+
+        return self.parse_response(response, query, elapsed_ms)
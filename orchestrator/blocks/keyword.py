@@ -1,20 +1,22 @@
 """Keyword search block using ElasticSearch multi_match query."""
 
 from typing import Any, Dict, List, Optional
-import time
 
 from elasticsearch import AsyncElasticsearch
 
-from .base import Block, BlockResult, SearchResult
+from .base import SearchBlock
+from .types import BlockResult
 
 
-class KeywordSearchBlock(Block):
+class KeywordSearchBlock(SearchBlock):
     """
     Keyword search using ElasticSearch multi_match query.
 
     Supports field boosting, operators, fuzziness, and minimum_should_match.
     """
 
+    __slots__ = ("_multi_match", "_boost", "_has_boost", "_size")
+
     def __init__(self, config: Dict[str, Any], es_client: AsyncElasticsearch, index: str):
         """
         Initialize keyword search block.
@@ -24,96 +26,87 @@ class KeywordSearchBlock(Block):
             es_client: ElasticSearch async client
             index: Index name to search
         """
-        super().__init__(config)
-        self.es_client = es_client
-        self.index = index
+        super().__init__(config, es_client, index)
+
+        # Everything but the query text is fixed by config, so resolve it once
+        multi_match = {
+            "fields": config.get("fields", ["*"]),
+            "type": "best_fields",  # Could be configurable
+            "operator": config.get("operator", "or"),
+        }
+
+        # Add optional parameters
+        if "minimum_should_match" in config:
+            multi_match["minimum_should_match"] = config["minimum_should_match"]
 
-    async def execute(
+        if "fuzziness" in config:
+            multi_match["fuzziness"] = config["fuzziness"]
+
+        self._multi_match = multi_match
+        self._boost = config.get("boost", 1.0)
+        self._has_boost = self._boost != 1.0
+        self._size = config.get("size", 10)
+
+    def build_body(
         self,
         query: str,
         query_vector: Optional[List[float]] = None,
         context: Optional[Dict[str, Any]] = None,
-        previous_results: Optional[List[BlockResult]] = None,
-    ) -> BlockResult:
+    ) -> Dict[str, Any]:
         """
-        Execute keyword search.
+        Build the keyword search request body.
 
         Args:
             query: Search query text
             query_vector: Unused for keyword search
             context: Additional context (filters, user info)
-            previous_results: Unused for keyword search
 
         Returns:
-            BlockResult with keyword search results
+            ElasticSearch request body
         """
-        start_time = time.time()
-
-        # Build multi_match query
-        multi_match = {
-            "query": query,
-            "fields": self.config.get("fields", ["*"]),
-            "type": "best_fields",  # Could be configurable
-            "operator": self.config.get("operator", "or"),
-        }
-
-        # Add optional parameters
-        if "minimum_should_match" in self.config:
-            multi_match["minimum_should_match"] = self.config["minimum_should_match"]
-
-        if "fuzziness" in self.config:
-            multi_match["fuzziness"] = self.config["fuzziness"]
-
-        # Build the complete query
-        es_query = {"query": {"multi_match": multi_match}}
+        es_query = {"multi_match": {"query": query, **self._multi_match}}
 
         # Add boost if specified
-        boost = self.config.get("boost", 1.0)
-        if boost != 1.0:
+        if self._has_boost:
             es_query = {
-                "query": {
-                    "function_score": {
-                        "query": es_query["query"],
-                        "boost": boost,
-                        "boost_mode": "multiply",
-                    }
+                "function_score": {
+                    "query": es_query,
+                    "boost": self._boost,
+                    "boost_mode": "multiply",
                 }
             }
 
         # Add filters from context if provided
         if context and "filters" in context:
-            es_query["query"] = {
+            es_query = {
                 "bool": {
-                    "must": es_query["query"],
+                    "must": es_query,
                     "filter": context["filters"],
                 }
             }
 
-        # Add size parameter
-        es_query["size"] = self.config.get("size", 10)
+        return {"query": es_query, "size": self._size}
 
-        # Execute search
-        response = await self.es_client.search(index=self.index, body=es_query)
+    def parse_response(
+        self, response: Dict[str, Any], query: str, took_ms: float
+    ) -> BlockResult:
+        """
+        Parse a keyword search response.
 
-        # Parse results
-        hits = []
-        for idx, hit in enumerate(response["hits"]["hits"]):
-            hits.append(
-                SearchResult(
-                    id=hit["_id"],
-                    score=hit["_score"],
-                    source=hit["_source"],
-                    index=hit["_index"],
-                    rank=idx + 1,
-                )
-            )
+        Args:
+            response: ElasticSearch search response
+            query: Search query text (for metadata)
+            took_ms: Client-side time spent on the request
 
-        elapsed_ms = (time.time() - start_time) * 1000
+        Returns:
+            BlockResult with keyword search results
+        """
+        hits, total = self._parse_hits(response)
 
         return BlockResult(
             hits=hits,
-            total=response["hits"]["total"]["value"],
-            took_ms=elapsed_ms,
+            total=total,
+            took_ms=took_ms,
             metadata={
                 "block_type": "keyword_search",
                 "query": query,
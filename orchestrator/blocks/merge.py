@@ -1,10 +1,13 @@
 """Merge block for combining results from multiple searches."""
 
+from collections import defaultdict
+from itertools import zip_longest
+from operator import itemgetter
 from typing import Any, Dict, List, Optional
 import time
-from collections import defaultdict
 
-from .base import Block, BlockResult, SearchResult
+from .base import Block
+from .types import BlockResult, SearchResult
 
 
 class MergeBlock(Block):
@@ -18,6 +21,34 @@ class MergeBlock(Block):
     - Interleave: Round-robin interleaving
     """
 
+    __slots__ = ("_strategy", "_merge_fn", "_k", "_weights", "_max_results")
+
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Initialize merge block.
+
+        Args:
+            config: Configuration dictionary (strategy, k, weights, max_results)
+
+        Raises:
+            ValueError: If the merge strategy is unknown
+        """
+        super().__init__(config)
+        self._strategy = config.get("strategy", "rrf")
+        self._k = config.get("k", 60)
+        self._weights = config.get("weights") or {}
+        self._max_results = config.get("max_results", 10)
+
+        strategies = {
+            "rrf": self._merge_rrf,
+            "weighted": self._merge_weighted,
+            "concatenate": self._merge_concatenate,
+            "interleave": self._merge_interleave,
+        }
+        if self._strategy not in strategies:
+            raise ValueError(f"Unknown merge strategy: {self._strategy}")
+        self._merge_fn = strategies[self._strategy]
+
     async def execute(
         self,
         query: str,
@@ -40,26 +71,14 @@ class MergeBlock(Block):
         if not previous_results or len(previous_results) == 0:
             raise ValueError("previous_results is required for merge block")
 
-        start_time = time.time()
-
-        strategy = self.config.get("strategy", "rrf")
+        start_ns = time.perf_counter_ns()
 
-        if strategy == "rrf":
-            merged = self._merge_rrf(previous_results)
-        elif strategy == "weighted":
-            merged = self._merge_weighted(previous_results)
-        elif strategy == "concatenate":
-            merged = self._merge_concatenate(previous_results)
-        elif strategy == "interleave":
-            merged = self._merge_interleave(previous_results)
-        else:
-            raise ValueError(f"Unknown merge strategy: {strategy}")
+        merged = self._merge_fn(previous_results)
 
         # Limit results
-        max_results = self.config.get("max_results", 10)
-        merged = merged[:max_results]
+        merged = merged[: self._max_results]
 
-        elapsed_ms = (time.time() - start_time) * 1000
+        elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
 
         return BlockResult(
             hits=merged,
@@ -67,7 +86,7 @@ class MergeBlock(Block):
             took_ms=elapsed_ms,
             metadata={
                 "block_type": "merge",
-                "strategy": strategy,
+                "strategy": self._strategy,
                 "num_sources": len(previous_results),
             },
         )
@@ -78,7 +97,7 @@ class MergeBlock(Block):
 
         RRF score = sum(1 / (k + rank)) for each occurrence
         """
-        k = self.config.get("k", 60)
+        k = self._k
         scores = defaultdict(float)
         doc_map = {}
 
@@ -86,23 +105,11 @@ class MergeBlock(Block):
             for hit in result_set.hits:
                 if hit.rank is None:
                     continue
-                rrf_score = 1.0 / (k + hit.rank)
-                scores[hit.id] += rrf_score
+                scores[hit.id] += 1.0 / (k + hit.rank)
                 if hit.id not in doc_map:
                     doc_map[hit.id] = hit
 
-        # Sort by RRF score
-        sorted_docs = sorted(scores.items(), key=lambda x: x[1], reverse=True)
-
-        # Build merged results
-        merged = []
-        for idx, (doc_id, score) in enumerate(sorted_docs):
-            result = doc_map[doc_id]
-            result.score = score
-            result.rank = idx + 1
-            merged.append(result)
-
-        return merged
+        return self._rank_by_score(scores, doc_map, self._max_results)
 
     def _merge_weighted(self, results: List[BlockResult]) -> List[SearchResult]:
         """
@@ -110,7 +117,7 @@ class MergeBlock(Block):
 
         Each result set can have a different weight.
         """
-        weights = self.config.get("weights", {})
+        weights = self._weights
         scores = defaultdict(float)
         doc_map = {}
 
@@ -121,12 +128,29 @@ class MergeBlock(Block):
                 if hit.id not in doc_map:
                     doc_map[hit.id] = hit
 
-        # Sort by weighted score
-        sorted_docs = sorted(scores.items(), key=lambda x: x[1], reverse=True)
+        return self._rank_by_score(scores, doc_map, self._max_results)
+
+    @staticmethod
+    def _rank_by_score(
+        scores: Dict[str, float], doc_map: Dict[str, SearchResult], max_results: int
+    ) -> List[SearchResult]:
+        """
+        Return the top documents by combined score.
+
+        Args:
+            scores: Combined score per document ID, in first-seen order
+            doc_map: First hit seen for each document ID
+            max_results: Maximum number of documents to return
+
+        Returns:
+            Up to max_results hits, best first; ties keep first-seen order
+        """
+        # sorted() is stable, so equal scores stay in first-seen order
+        sorted_docs = sorted(scores.items(), key=itemgetter(1), reverse=True)
 
         # Build merged results
         merged = []
-        for idx, (doc_id, score) in enumerate(sorted_docs):
+        for idx, (doc_id, score) in enumerate(sorted_docs[: max(max_results, 0)]):
             result = doc_map[doc_id]
             result.score = score
             result.rank = idx + 1
@@ -148,16 +172,17 @@ class MergeBlock(Block):
     def _merge_interleave(self, results: List[BlockResult]) -> List[SearchResult]:
         """Round-robin interleaving of results."""
         merged = []
-        max_len = max(len(r.hits) for r in results)
         seen = set()
+        rank = 0
 
-        for i in range(max_len):
-            for result_set in results:
-                if i < len(result_set.hits):
-                    hit = result_set.hits[i]
-                    if hit.id not in seen:
-                        seen.add(hit.id)
-                        hit.rank = len(merged) + 1
-                        merged.append(hit)
+        # Shorter result sets are padded with None once exhausted
+        for group in zip_longest(*(r.hits for r in results)):
+            for hit in group:
+                if hit is None or hit.id in seen:
+                    continue
+                seen.add(hit.id)
+                rank += 1
+                hit.rank = rank
+                merged.append(hit)
 
         return merged
@@ -3,7 +3,8 @@
 from typing import Any, Dict, List, Optional
 import time
 
-from .base import Block, BlockResult, SearchResult
+from .base import Block
+from .types import BlockResult
 
 
 class RerankBlock(Block):
@@ -15,6 +16,8 @@ class RerankBlock(Block):
     - Custom scoring functions
     """
 
+    __slots__ = ()
+
     async def execute(
         self,
         query: str,
@@ -41,13 +44,13 @@ class RerankBlock(Block):
         # In production, you might want to merge first
         results = previous_results[-1]
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         # Apply boosting
         if "boost_by_field" in self.config:
             results = self._boost_by_field(results)
 
-        elapsed_ms = (time.time() - start_time) * 1000
+        elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
 
         return BlockResult(
             hits=results.hits,
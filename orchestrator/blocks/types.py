@@ -0,0 +1,45 @@
+"""Lightweight result types passed between blocks."""
+
+from typing import Any, Dict, List, Optional
+
+
+class SearchResult:
+    """A single search result."""
+
+    __slots__ = ("id", "score", "source", "index", "rank")
+
+    def __init__(
+        self,
+        id: str,
+        score: float,
+        source: Dict[str, Any],
+        index: Optional[str] = None,
+        rank: Optional[int] = None,
+    ):
+        self.id = id
+        self.score = score
+        self.source = source
+        self.index = index
+        self.rank = rank
+
+    def _asdict(self) -> Dict[str, Any]:
+        """Return the fields exposed in API responses."""
+        return {"id": self.id, "score": self.score, "rank": self.rank, "source": self.source}
+
+
+class BlockResult:
+    """Result from executing a block."""
+
+    __slots__ = ("hits", "total", "took_ms", "metadata")
+
+    def __init__(
+        self,
+        hits: List[SearchResult],
+        total: int,
+        took_ms: Optional[float] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ):
+        self.hits = hits
+        self.total = total
+        self.took_ms = took_ms
+        self.metadata = metadata if metadata is not None else {}
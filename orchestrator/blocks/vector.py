@@ -1,20 +1,22 @@
 """Vector/semantic search block using ElasticSearch kNN search."""
 
 from typing import Any, Dict, List, Optional
-import time
 
 from elasticsearch import AsyncElasticsearch
 
-from .base import Block, BlockResult, SearchResult
+from .base import SearchBlock
+from .types import BlockResult
 
 
-class VectorSearchBlock(Block):
+class VectorSearchBlock(SearchBlock):
     """
     Vector/semantic search using ElasticSearch kNN search.
 
     Requires query_vector to be provided or a vector generation function.
     """
 
+    __slots__ = ("_knn",)
+
     def __init__(self, config: Dict[str, Any], es_client: AsyncElasticsearch, index: str):
         """
         Initialize vector search block.
@@ -24,87 +26,79 @@ class VectorSearchBlock(Block):
             es_client: ElasticSearch async client
             index: Index name to search
         """
-        super().__init__(config)
-        self.es_client = es_client
-        self.index = index
+        super().__init__(config, es_client, index)
+
+        # Everything but the query vector is fixed by config, so resolve it once
+        knn_query = {
+            "field": config["field"],
+            "k": config.get("k", 10),
+            "num_candidates": config.get("num_candidates", 100),
+        }
 
-    async def execute(
+        # Add similarity if specified
+        if "similarity" in config:
+            knn_query["similarity"] = config["similarity"]
+
+        # Add boost if specified
+        boost = config.get("boost", 1.0)
+        if boost != 1.0:
+            knn_query["boost"] = boost
+
+        self._knn = knn_query
+
+    def build_body(
         self,
         query: str,
         query_vector: Optional[List[float]] = None,
         context: Optional[Dict[str, Any]] = None,
-        previous_results: Optional[List[BlockResult]] = None,
-    ) -> BlockResult:
+    ) -> Dict[str, Any]:
         """
-        Execute vector search.
+        Build the kNN search request body.
 
         Args:
             query: Search query text (for metadata only)
             query_vector: Query embedding vector (required)
             context: Additional context (filters, user info)
-            previous_results: Unused for vector search
 
         Returns:
-            BlockResult with vector search results
+            ElasticSearch request body
         """
         if query_vector is None:
             raise ValueError("query_vector is required for vector search")
 
-        start_time = time.time()
-
-        # Build kNN query
-        knn_query = {
-            "field": self.config["field"],
-            "query_vector": query_vector,
-            "k": self.config.get("k", 10),
-            "num_candidates": self.config.get("num_candidates", 100),
-        }
-
-        # Add similarity if specified
-        if "similarity" in self.config:
-            knn_query["similarity"] = self.config["similarity"]
-
-        # Add boost if specified
-        boost = self.config.get("boost", 1.0)
-        if boost != 1.0:
-            knn_query["boost"] = boost
+        knn_query = {**self._knn, "query_vector": query_vector}
 
         # Add filters from context if provided
         if context and "filters" in context:
             knn_query["filter"] = context["filters"]
 
-        # Execute kNN search
-        es_query = {
-            "knn": knn_query,
-            "size": self.config.get("k", 10),
-        }
+        return {"knn": knn_query, "size": self._knn["k"]}
 
-        response = await self.es_client.search(index=self.index, body=es_query)
+    def parse_response(
+        self, response: Dict[str, Any], query: str, took_ms: float
+    ) -> BlockResult:
+        """
+        Parse a kNN search response.
 
-        # Parse results
-        hits = []
-        for idx, hit in enumerate(response["hits"]["hits"]):
-            hits.append(
-                SearchResult(
-                    id=hit["_id"],
-                    score=hit["_score"],
-                    source=hit["_source"],
-                    index=hit["_index"],
-                    rank=idx + 1,
-                )
-            )
+        Args:
+            response: ElasticSearch search response
+            query: Search query text (for metadata)
+            took_ms: Client-side time spent on the request
 
-        elapsed_ms = (time.time() - start_time) * 1000
+        Returns:
+            BlockResult with vector search results
+        """
+        hits, total = self._parse_hits(response)
 
         return BlockResult(
             hits=hits,
-            total=response["hits"]["total"]["value"] if "total" in response["hits"] else len(hits),
-            took_ms=elapsed_ms,
+            total=total,
+            took_ms=took_ms,
             metadata={
                 "block_type": "vector_search",
                 "query": query,
                 "es_took_ms": response["took"],
-                "k": self.config.get("k", 10),
-                "num_candidates": self.config.get("num_candidates", 100),
+                "k": self._knn["k"],
+                "num_candidates": self._knn["num_candidates"],
             },
         )
@@ -1,17 +1,35 @@
 """Configuration and schema definitions for search algorithms."""
 
-from .schema import (
-    AlgorithmConfig,
-    BlockConfig,
-    KeywordSearchConfig,
-    VectorSearchConfig,
-    MergeConfig,
-    RerankConfig,
-    BlockType,
-    MergeStrategy,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .settings import Settings, get_settings
 
+if TYPE_CHECKING:
+    from .schema import (
+        AlgorithmConfig,
+        BlockConfig,
+        KeywordSearchConfig,
+        VectorSearchConfig,
+        MergeConfig,
+        RerankConfig,
+        BlockType,
+        MergeStrategy,
+    )
+
+# Schema models are imported on first access (PEP 562), so importing only the
+# settings does not build every Pydantic model
+_LAZY_ATTRIBUTES = {
+    "AlgorithmConfig": ".schema",
+    "BlockConfig": ".schema",
+    "KeywordSearchConfig": ".schema",
+    "VectorSearchConfig": ".schema",
+    "MergeConfig": ".schema",
+    "RerankConfig": ".schema",
+    "BlockType": ".schema",
+    "MergeStrategy": ".schema",
+}
+
 __all__ = [
     "AlgorithmConfig",
     "BlockConfig",
@@ -24,3 +42,13 @@ __all__ = [
     "Settings",
     "get_settings",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily exported attributes on first access."""
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -4,11 +4,11 @@ Schema definitions for algorithm configurations.
 Defines the structure of composable search algorithms using Pydantic models.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Dict, List, Optional, Union
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class BlockType(str, Enum):
@@ -35,6 +35,8 @@ class MergeStrategy(str, Enum):
 class KeywordSearchConfig(BaseModel):
     """Configuration for keyword search block."""
 
+    model_config = ConfigDict(frozen=True)
+
     fields: List[str] = Field(
         description="Fields to search with optional boost (e.g., 'title^3')"
     )
@@ -51,6 +53,8 @@ class KeywordSearchConfig(BaseModel):
 class VectorSearchConfig(BaseModel):
     """Configuration for vector/semantic search block."""
 
+    model_config = ConfigDict(frozen=True)
+
     field: str = Field(description="Name of the dense_vector field")
     k: int = Field(default=10, description="Number of results to return")
     num_candidates: int = Field(
@@ -65,6 +69,8 @@ class VectorSearchConfig(BaseModel):
 class MergeConfig(BaseModel):
     """Configuration for merging multiple result sets."""
 
+    model_config = ConfigDict(frozen=True)
+
     strategy: MergeStrategy = Field(description="Merge strategy to use")
     weights: Optional[Dict[str, float]] = Field(
         default=None, description="Weights for weighted merge strategy"
@@ -76,6 +82,8 @@ class MergeConfig(BaseModel):
 class RerankConfig(BaseModel):
     """Configuration for re-ranking results."""
 
+    model_config = ConfigDict(frozen=True)
+
     function_score: Optional[Dict[str, Any]] = Field(
         default=None, description="ElasticSearch function_score configuration"
     )
@@ -91,6 +99,8 @@ class RerankConfig(BaseModel):
 class FilterConfig(BaseModel):
     """Configuration for filtering results."""
 
+    model_config = ConfigDict(frozen=True)
+
     filters: List[Dict[str, Any]] = Field(
         description="List of ElasticSearch filter clauses"
     )
@@ -99,25 +109,29 @@ class FilterConfig(BaseModel):
 class BlockConfig(BaseModel):
     """Configuration for a single composable block."""
 
+    model_config = ConfigDict(frozen=True)
+
     type: BlockType = Field(description="Type of the block")
     config: Dict[str, Any] = Field(description="Block-specific configuration")
     name: Optional[str] = Field(default=None, description="Optional name for this block")
     enabled: bool = Field(default=True, description="Whether this block is enabled")
 
-    @field_validator("config")
-    @classmethod
-    def validate_config(cls, v: Dict[str, Any], info) -> Dict[str, Any]:
-        """Validate block config matches its type."""
-        # This could be enhanced to validate config structure per block type
-        return v
+
+def _utc_now() -> datetime:
+    """Current time as a timezone-aware UTC datetime."""
+    return datetime.now(timezone.utc)
 
 
 class AlgorithmMetadata(BaseModel):
     """Metadata about the algorithm."""
 
+    model_config = ConfigDict(frozen=True)
+
     created_by: Optional[str] = None
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utc_now)
+    updated_at: Optional[datetime] = Field(
+        default=None, description="Defaults to created_at"
+    )
     status: str = Field(
         default="draft", description="Status: draft, testing, production"
     )
@@ -125,6 +139,12 @@ class AlgorithmMetadata(BaseModel):
     description: Optional[str] = None
     tags: List[str] = Field(default_factory=list)
 
+    def model_post_init(self, __context: Any) -> None:
+        """Default updated_at to created_at, sharing one timestamp."""
+        if self.updated_at is None:
+            # Bypass the frozen-model guard while the instance is being built
+            object.__setattr__(self, "updated_at", self.created_at)
+
 
 class AlgorithmConfig(BaseModel):
     """Complete algorithm configuration."""
@@ -135,7 +155,7 @@ class AlgorithmConfig(BaseModel):
     components: List[BlockConfig] = Field(description="Ordered list of components")
     metadata: AlgorithmMetadata = Field(default_factory=AlgorithmMetadata)
 
-    model_config = {"json_schema_extra": {
+    model_config = ConfigDict(frozen=True, json_schema_extra={
         "example": {
             "algorithm_id": "hybrid-search-v1",
             "version": "1.0",
@@ -172,4 +192,4 @@ class AlgorithmConfig(BaseModel):
                 "description": "Combines keyword and vector search using RRF",
             },
         }
-    }}
+    })
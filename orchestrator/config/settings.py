@@ -1,8 +1,9 @@
 """Application settings using Pydantic settings management."""
 
 from functools import lru_cache
-from typing import List
+from typing import Any, Tuple
 
+from pydantic import PrivateAttr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -14,11 +15,19 @@ class Settings(BaseSettings):
     elasticsearch_username: str = "elastic"
     elasticsearch_password: str = "changeme"
     elasticsearch_index_prefix: str = "search_"
+    elasticsearch_verify_certs: bool = True
+    # Pooled HTTP connections per ES node, shared by all concurrent requests
+    elasticsearch_connections_per_node: int = 32
+    # Run search + RRF merge as one request via the rrf retriever (ES 8.14+, licensed)
+    elasticsearch_rrf_retriever: bool = False
 
     # API Configuration
     api_host: str = "0.0.0.0"
     api_port: int = 8000
     api_reload: bool = True
+    api_workers: int = 1
+    api_access_log: bool = False
+    production: bool = False
 
     # Algorithm Storage
     algorithm_config_path: str = "./configs/algorithms"
@@ -34,10 +43,16 @@ class Settings(BaseSettings):
         case_sensitive=False,
     )
 
+    _hosts: Tuple[str, ...] = PrivateAttr(default=())
+
+    def model_post_init(self, __context: Any) -> None:
+        """Parse comma-separated hosts once, at construction."""
+        self._hosts = tuple(h.strip() for h in self.elasticsearch_hosts.split(","))
+
     @property
-    def elasticsearch_hosts_list(self) -> List[str]:
-        """Parse comma-separated hosts into a list."""
-        return [h.strip() for h in self.elasticsearch_hosts.split(",")]
+    def elasticsearch_hosts_list(self) -> Tuple[str, ...]:
+        """Comma-separated hosts as a tuple, parsed at construction."""
+        return self._hosts
 
 
 @lru_cache()
@@ -1,11 +1,37 @@
 """Core orchestration engine."""
 
-from .client import ElasticsearchClient
-from .executor import AlgorithmExecutor
-from .builder import BlockFactory
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .client import ElasticsearchClient, close_global_client, get_global_client
+    from .executor import AlgorithmExecutor
+    from .builder import BlockFactory
+
+# Imported on first access (PEP 562), so using the client alone does not
+# import the executor and every block
+_LAZY_ATTRIBUTES = {
+    "ElasticsearchClient": ".client",
+    "close_global_client": ".client",
+    "get_global_client": ".client",
+    "AlgorithmExecutor": ".executor",
+    "BlockFactory": ".builder",
+}
 
 __all__ = [
     "ElasticsearchClient",
+    "close_global_client",
+    "get_global_client",
     "AlgorithmExecutor",
     "BlockFactory",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily exported attributes on first access."""
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -1,23 +1,23 @@
 """Factory for creating block instances from configuration."""
 
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Type
 
-from elasticsearch import AsyncElasticsearch
-
-from orchestrator.blocks import (
-    Block,
-    KeywordSearchBlock,
-    VectorSearchBlock,
-    MergeBlock,
-    RerankBlock,
-)
 from orchestrator.config import BlockType
 
+if TYPE_CHECKING:
+    from elasticsearch import AsyncElasticsearch
+
+    from orchestrator.blocks import Block
+
 
 class BlockFactory:
     """Factory for creating block instances from configuration."""
 
-    def __init__(self, es_client: AsyncElasticsearch, default_index: str):
+    # Block class for each type, and whether it needs the ES client and index.
+    # Built on first use so importing the factory does not import every block.
+    _REGISTRY: Optional[Dict[BlockType, Tuple[Type["Block"], bool]]] = None
+
+    def __init__(self, es_client: "AsyncElasticsearch", default_index: str):
         """
         Initialize block factory.
 
@@ -28,7 +28,43 @@ class BlockFactory:
         self.es_client = es_client
         self.default_index = default_index
 
-    def create_block(self, block_type: BlockType, config: Dict[str, Any]) -> Block:
+    @classmethod
+    def _registry(cls) -> Dict[BlockType, Tuple[Type["Block"], bool]]:
+        """Get the block registry, importing the built-in blocks on first use."""
+        if cls._REGISTRY is None:
+            from orchestrator.blocks import (
+                KeywordSearchBlock,
+                VectorSearchBlock,
+                MergeBlock,
+                RerankBlock,
+            )
+
+            BlockFactory._REGISTRY = {
+                BlockType.KEYWORD_SEARCH: (KeywordSearchBlock, True),
+                BlockType.VECTOR_SEARCH: (VectorSearchBlock, True),
+                BlockType.MERGE: (MergeBlock, False),
+                BlockType.RERANK: (RerankBlock, False),
+            }
+        return cls._REGISTRY
+
+    @classmethod
+    def register(
+        cls, block_type: BlockType, block_cls: Type["Block"], needs_es: bool = True
+    ) -> None:
+        """
+        Register the block class used for a block type.
+
+        Call at import time, before algorithms using that type are compiled;
+        executors keep the blocks of plans they have already compiled.
+
+        Args:
+            block_type: Block type to register
+            block_cls: Block class to instantiate for that type
+            needs_es: Whether the class takes the ES client and index
+        """
+        cls._registry()[block_type] = (block_cls, needs_es)
+
+    def create_block(self, block_type: BlockType, config: Dict[str, Any]) -> "Block":
         """
         Create a block instance from configuration.
 
@@ -42,20 +78,14 @@ class BlockFactory:
         Raises:
             ValueError: If block type is unknown
         """
-        # Get index from config or use default
-        index = config.get("index", self.default_index)
-
-        if block_type == BlockType.KEYWORD_SEARCH:
-            return KeywordSearchBlock(config, self.es_client, index)
-
-        elif block_type == BlockType.VECTOR_SEARCH:
-            return VectorSearchBlock(config, self.es_client, index)
-
-        elif block_type == BlockType.MERGE:
-            return MergeBlock(config)
+        try:
+            block_cls, needs_es = self._registry()[block_type]
+        except KeyError:
+            raise ValueError(f"Unknown block type: {block_type}") from None
 
-        elif block_type == BlockType.RERANK:
-            return RerankBlock(config)
+        if needs_es:
+            # Get index from config or use default
+            index = config.get("index", self.default_index)
+            return block_cls(config, self.es_client, index)
 
-        else:
-            raise ValueError(f"Unknown block type: {block_type}")
+        return block_cls(config)
@@ -1,11 +1,14 @@
 """ElasticSearch client wrapper with connection management."""
 
-from typing import List, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from elasticsearch import AsyncElasticsearch
 
 from orchestrator.config import Settings
 
+# Client shared by every request in this process (one per uvicorn worker)
+_global_client: Optional["ElasticsearchClient"] = None
+
 
 class ElasticsearchClient:
     """Wrapper for ElasticSearch async client with connection management."""
@@ -29,7 +32,9 @@ class ElasticsearchClient:
                     self.settings.elasticsearch_username,
                     self.settings.elasticsearch_password,
                 ),
-                verify_certs=False,  # For development; use True in production
+                verify_certs=self.settings.elasticsearch_verify_certs,
+                connections_per_node=self.settings.elasticsearch_connections_per_node,
+                http_compress=True,
             )
 
             # Verify connection
@@ -49,11 +54,44 @@ class ElasticsearchClient:
             await self.connect()
         return self._client
 
-    async def health_check(self) -> bool:
-        """Check if ElasticSearch is healthy."""
+    async def health_check(self) -> Tuple[bool, Dict[str, Any]]:
+        """
+        Check if ElasticSearch is healthy.
+
+        Returns:
+            Tuple of (healthy, cluster health response); the response is empty
+            if the cluster could not be reached
+        """
         try:
             client = await self.get_client()
             health = await client.cluster.health()
-            return health["status"] in ["green", "yellow"]
+            return health["status"] in ("green", "yellow"), health
         except Exception:
-            return False
+            return False, {}
+
+
+async def get_global_client(settings: Settings) -> ElasticsearchClient:
+    """
+    Get the process-wide ElasticSearch client, connecting it on first use.
+
+    Args:
+        settings: Application settings, used when the client is created
+
+    Returns:
+        Connected ElasticsearchClient shared by all callers
+    """
+    global _global_client
+    # No await between the check and the assignment, so concurrent callers
+    # cannot create a second client
+    if _global_client is None:
+        _global_client = ElasticsearchClient(settings)
+    await _global_client.get_client()
+    return _global_client
+
+
+async def close_global_client():
+    """Close the process-wide ElasticSearch client, if one was created."""
+    global _global_client
+    if _global_client is not None:
+        await _global_client.disconnect()
+        _global_client = None
@@ -1,17 +1,42 @@
 """Algorithm executor - orchestrates the execution of search algorithms."""
 
 import asyncio
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 import time
 
-from orchestrator.blocks import Block, BlockResult
-from orchestrator.config import AlgorithmConfig, BlockType
+from orchestrator.blocks import (
+    Block,
+    BlockResult,
+    KeywordSearchBlock,
+    MergeBlock,
+    SearchBlock,
+    SearchResult,
+    VectorSearchBlock,
+)
+from orchestrator.config import AlgorithmConfig, BlockConfig, BlockType
 from orchestrator.core.builder import BlockFactory
 
+# Upper bound on compiled plans kept per executor
+MAX_CACHED_PLANS = 256
+
+# Block types that run in the search phase
+SEARCH_BLOCK_TYPES = frozenset(
+    (BlockType.KEYWORD_SEARCH, BlockType.VECTOR_SEARCH, BlockType.HYBRID_SEARCH)
+)
+
 
 class ExecutionResult:
     """Result from executing an algorithm."""
 
+    __slots__ = (
+        "algorithm_id",
+        "query",
+        "final_result",
+        "intermediate_results",
+        "total_time_ms",
+        "metadata",
+    )
+
     def __init__(
         self,
         algorithm_id: str,
@@ -33,15 +58,7 @@ class ExecutionResult:
         return {
             "algorithm_id": self.algorithm_id,
             "query": self.query,
-            "hits": [
-                {
-                    "id": hit.id,
-                    "score": hit.score,
-                    "rank": hit.rank,
-                    "source": hit.source,
-                }
-                for hit in self.final_result.hits
-            ],
+            "hits": [hit._asdict() for hit in self.final_result.hits],
             "total": self.final_result.total,
             "took_ms": self.total_time_ms,
             "metadata": {
@@ -58,6 +75,35 @@ class ExecutionResult:
         }
 
 
+class CompiledPlan:
+    """Blocks of an algorithm, built once and grouped into execution phases."""
+
+    __slots__ = ("components", "blocks", "search_blocks", "post_search_blocks")
+
+    def __init__(
+        self,
+        components: List[BlockConfig],
+        blocks: Tuple[Tuple[Block, bool], ...],
+        search_blocks: Optional[Tuple[Block, ...]],
+        post_search_blocks: Optional[Tuple[Block, ...]],
+    ):
+        """
+        Initialize compiled plan.
+
+        Args:
+            components: Component list the plan was compiled from
+            blocks: Each enabled block in order, with whether it is a search block
+            search_blocks: Blocks of the parallel search phase, or None if a
+                search block follows a merge/rerank block
+            post_search_blocks: Merge/rerank blocks run after the searches,
+                or None if a search block follows a merge/rerank block
+        """
+        self.components = components
+        self.blocks = blocks
+        self.search_blocks = search_blocks
+        self.post_search_blocks = post_search_blocks
+
+
 class AlgorithmExecutor:
     """
     Executes search algorithms composed of multiple blocks.
@@ -65,14 +111,19 @@ class AlgorithmExecutor:
     Handles orchestration, parallel execution, and result passing between blocks.
     """
 
-    def __init__(self, block_factory: BlockFactory):
+    def __init__(self, block_factory: BlockFactory, fuse_hybrid_rrf: bool = False):
         """
         Initialize algorithm executor.
 
         Args:
             block_factory: Factory for creating block instances
+            fuse_hybrid_rrf: Run search blocks followed by an RRF merge as a
+                single request using the ElasticSearch rrf retriever
+                (requires ElasticSearch 8.14+ with an RRF-enabled license)
         """
         self.block_factory = block_factory
+        self.fuse_hybrid_rrf = fuse_hybrid_rrf
+        self._plan_cache: Dict[Tuple[str, str], CompiledPlan] = {}
 
     async def execute(
         self,
@@ -93,24 +144,17 @@ class AlgorithmExecutor:
         Returns:
             ExecutionResult with final and intermediate results
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         intermediate_results = []
 
-        # Filter enabled components
-        enabled_components = [c for c in algorithm.components if c.enabled]
-
-        if not enabled_components:
-            raise ValueError("No enabled components in algorithm")
+        plan = self._get_plan(algorithm)
 
         # Group components by execution order
         # For now, simple sequential execution
         # TODO: Support parallel execution for independent blocks
         previous_results = None
 
-        for component in enabled_components:
-            # Create block instance
-            block = self.block_factory.create_block(component.type, component.config)
-
+        for block, is_search in plan.blocks:
             # Execute block
             result = await block.execute(
                 query=query,
@@ -122,11 +166,7 @@ class AlgorithmExecutor:
             intermediate_results.append(result)
 
             # Pass result to next block if it's not a merge/rerank
-            if component.type in [
-                BlockType.KEYWORD_SEARCH,
-                BlockType.VECTOR_SEARCH,
-                BlockType.HYBRID_SEARCH,
-            ]:
+            if is_search:
                 # For search blocks, accumulate results for merging
                 if previous_results is None:
                     previous_results = result
@@ -141,7 +181,7 @@ class AlgorithmExecutor:
         # Final result is the last intermediate result
         final_result = intermediate_results[-1]
 
-        total_time_ms = (time.time() - start_time) * 1000
+        total_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
 
         return ExecutionResult(
             algorithm_id=algorithm.algorithm_id,
@@ -177,57 +217,272 @@ class AlgorithmExecutor:
         Returns:
             ExecutionResult with final and intermediate results
         """
-        start_time = time.time()
-        intermediate_results = []
+        start_ns = time.perf_counter_ns()
 
-        enabled_components = [c for c in algorithm.components if c.enabled]
+        blocks, post_search_blocks = self._phases(self._get_plan(algorithm))
 
-        if not enabled_components:
-            raise ValueError("No enabled components in algorithm")
+        # Execute search blocks in parallel
+        if blocks:
+            fused_body = self._try_fuse_hybrid(
+                blocks, post_search_blocks, query, query_vector, context
+            )
+            if fused_body is not None:
+                # ES ran the searches and the RRF merge; skip the merge block
+                fused_result = await self._execute_fused(blocks, fused_body, query)
+                return await self._finish_parallel(
+                    algorithm,
+                    query,
+                    query_vector,
+                    context,
+                    [fused_result],
+                    post_search_blocks[1:],
+                    start_ns,
+                    num_searches=len(blocks),
+                )
+
+            search_results = await self._run_search_phase(blocks, query, query_vector, context)
+        else:
+            search_results = []
+
+        return await self._finish_parallel(
+            algorithm,
+            query,
+            query_vector,
+            context,
+            search_results,
+            post_search_blocks,
+            start_ns,
+        )
+
+    async def execute_batch(
+        self,
+        algorithms: List[AlgorithmConfig],
+        query: str,
+        query_vector: Optional[List[float]] = None,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> List[Union[ExecutionResult, Exception]]:
+        """
+        Execute several algorithms for the same query.
+
+        The SearchBlocks of every algorithm are sent together in a single
+        _msearch request. Other search-phase blocks (e.g. registered plugin
+        blocks) run through their own execute() alongside it. Merge/rerank
+        blocks then run locally per algorithm. With fuse_hybrid_rrf, an
+        algorithm that execute_parallel_searches would fuse sends its rrf
+        retriever request as one _msearch entry instead, so both paths return
+        the same hits. A failing algorithm does not affect the others.
+
+        Args:
+            algorithms: Algorithm configurations
+            query: Search query text
+            query_vector: Optional pre-computed query embedding
+            context: Additional context
 
-        # Group components into phases
-        search_blocks = []
-        post_search_blocks = []
-        in_search_phase = True
-
-        for component in enabled_components:
-            if component.type in [
-                BlockType.KEYWORD_SEARCH,
-                BlockType.VECTOR_SEARCH,
-                BlockType.HYBRID_SEARCH,
-            ]:
-                if in_search_phase:
-                    search_blocks.append(component)
+        Returns:
+            One ExecutionResult, or the exception it failed with, per algorithm
+        """
+        start_ns = time.perf_counter_ns()
+        outcomes: List[Union[ExecutionResult, Exception, None]] = [None] * len(algorithms)
+
+        # Plan every algorithm; SearchBlocks get a body in the shared _msearch,
+        # any other search-phase block runs on its own
+        planned = []
+        searches = []
+        separate_tasks = []
+        for position, algorithm in enumerate(algorithms):
+            try:
+                blocks, post_search_blocks = self._phases(self._get_plan(algorithm))
+                fused_body = self._try_fuse_hybrid(
+                    blocks, post_search_blocks, query, query_vector, context
+                )
+                bodies = None
+                if fused_body is None:
+                    bodies = [
+                        (
+                            block.build_body(query, query_vector, context)
+                            if isinstance(block, SearchBlock)
+                            else None
+                        )
+                        for block in blocks
+                    ]
+            except Exception as e:
+                outcomes[position] = e
+                continue
+
+            if fused_body is not None:
+                # ES runs the searches and the RRF merge as one _msearch entry
+                searches.append({"index": blocks[0].index})
+                searches.append(fused_body)
+                planned.append((position, algorithm, blocks, None, post_search_blocks))
+                continue
+
+            for block, body in zip(blocks, bodies):
+                if body is not None:
+                    searches.append({"index": block.index})
+                    searches.append(body)
                 else:
-                    raise ValueError(
-                        "Search blocks must come before merge/rerank blocks"
+                    separate_tasks.append(
+                        block.execute(
+                            query=query,
+                            query_vector=query_vector,
+                            context=context,
+                            previous_results=None,
+                        )
                     )
-            else:
-                in_search_phase = False
-                post_search_blocks.append(component)
+            planned.append((position, algorithm, blocks, bodies, post_search_blocks))
 
-        # Execute search blocks in parallel
-        if search_blocks:
-            search_tasks = []
-            for component in search_blocks:
-                block = self.block_factory.create_block(component.type, component.config)
-                task = block.execute(
-                    query=query,
-                    query_vector=query_vector,
-                    context=context,
-                    previous_results=None,
+        msearch_outcome, *separate_outcomes = await asyncio.gather(
+            self._msearch_bodies(searches), *separate_tasks, return_exceptions=True
+        )
+
+        elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+
+        # Hand each outcome back to its block, then finish each algorithm
+        msearch_failed = isinstance(msearch_outcome, BaseException)
+        responses = iter(() if msearch_failed else msearch_outcome)
+        separate_results = iter(separate_outcomes)
+        for position, algorithm, blocks, bodies, post_search_blocks in planned:
+            # Take this algorithm's outcomes before anything can fail, so later
+            # algorithms still line up with their own
+            if bodies is None:
+                # Fused algorithms have a single _msearch entry
+                block_outcomes = [msearch_outcome if msearch_failed else next(responses)]
+            else:
+                block_outcomes = []
+                for body in bodies:
+                    if body is None:
+                        block_outcomes.append(next(separate_results))
+                    elif msearch_failed:
+                        block_outcomes.append(msearch_outcome)
+                    else:
+                        block_outcomes.append(next(responses))
+            try:
+                for outcome in block_outcomes:
+                    if isinstance(outcome, BaseException):
+                        raise outcome
+                num_searches = None
+                if bodies is None:
+                    # The fused entry stands in for the searches and the merge block
+                    search_results = [
+                        self._parse_fused_response(blocks, block_outcomes[0], elapsed_ms)
+                    ]
+                    post_search_blocks = post_search_blocks[1:]
+                    num_searches = len(blocks)
+                else:
+                    search_results = [
+                        (
+                            self._parse_msearch_response(block, outcome, query, elapsed_ms)
+                            if body is not None
+                            else outcome
+                        )
+                        for block, body, outcome in zip(blocks, bodies, block_outcomes)
+                    ]
+                outcomes[position] = await self._finish_parallel(
+                    algorithm,
+                    query,
+                    query_vector,
+                    context,
+                    search_results,
+                    post_search_blocks,
+                    start_ns,
+                    num_searches=num_searches,
                 )
-                search_tasks.append(task)
+            except Exception as e:
+                outcomes[position] = e
+
+        return outcomes
+
+    def _get_plan(self, algorithm: AlgorithmConfig) -> CompiledPlan:
+        """
+        Get the compiled plan for an algorithm, compiling it on first use.
 
-            search_results = await asyncio.gather(*search_tasks)
-            intermediate_results.extend(search_results)
+        Plans are keyed by (algorithm_id, version) and only reused for the
+        component list they were compiled from, so a reloaded or edited
+        configuration (e.g. a new updated_at) is compiled again.
+
+        Args:
+            algorithm: Algorithm configuration
+
+        Returns:
+            CompiledPlan for the algorithm
+        """
+        key = (algorithm.algorithm_id, algorithm.version)
+        plan = self._plan_cache.get(key)
+        if plan is None or plan.components is not algorithm.components:
+            plan = self._compile(algorithm)
+            if key not in self._plan_cache and len(self._plan_cache) >= MAX_CACHED_PLANS:
+                self._plan_cache.clear()
+            self._plan_cache[key] = plan
+        return plan
+
+    def _compile(self, algorithm: AlgorithmConfig) -> CompiledPlan:
+        """
+        Compile an algorithm into blocks grouped by execution phase.
+
+        Args:
+            algorithm: Algorithm configuration
+
+        Returns:
+            CompiledPlan for the algorithm
+
+        Raises:
+            ValueError: If no component is enabled or a block type is unknown
+        """
+        # Filter enabled components
+        enabled_components = [c for c in algorithm.components if c.enabled]
+
+        if not enabled_components:
+            raise ValueError("No enabled components in algorithm")
+
+        create_block = self.block_factory.create_block
+        blocks = tuple(
+            (create_block(c.type, c.config), c.type in SEARCH_BLOCK_TYPES)
+            for c in enabled_components
+        )
+
+        # Group blocks into phases; parallel execution needs every search
+        # block ahead of the merge/rerank blocks
+        num_search = 0
+        while num_search < len(blocks) and blocks[num_search][1]:
+            num_search += 1
+
+        if any(is_search for _, is_search in blocks[num_search:]):
+            search_blocks = post_search_blocks = None
         else:
-            search_results = []
+            search_blocks = tuple(block for block, _ in blocks[:num_search])
+            post_search_blocks = tuple(block for block, _ in blocks[num_search:])
+
+        return CompiledPlan(algorithm.components, blocks, search_blocks, post_search_blocks)
+
+    @staticmethod
+    def _phases(plan: CompiledPlan) -> Tuple[Tuple[Block, ...], Tuple[Block, ...]]:
+        """
+        Get the search and post-search phases of a plan.
+
+        Raises:
+            ValueError: If a search block follows a merge/rerank block
+        """
+        if plan.search_blocks is None:
+            raise ValueError("Search blocks must come before merge/rerank blocks")
+        return plan.search_blocks, plan.post_search_blocks
+
+    async def _finish_parallel(
+        self,
+        algorithm: AlgorithmConfig,
+        query: str,
+        query_vector: Optional[List[float]],
+        context: Optional[Dict[str, Any]],
+        search_results: List[BlockResult],
+        post_search_blocks: Sequence[Block],
+        start_ns: int,
+        num_searches: Optional[int] = None,
+    ) -> ExecutionResult:
+        """Run post-search blocks over search results and build the ExecutionResult."""
+        intermediate_results = list(search_results)
 
         # Execute post-search blocks sequentially
         previous_results = search_results
-        for component in post_search_blocks:
-            block = self.block_factory.create_block(component.type, component.config)
+        for block in post_search_blocks:
             result = await block.execute(
                 query=query,
                 query_vector=query_vector,
@@ -240,7 +495,7 @@ class AlgorithmExecutor:
         # Final result is the last intermediate result
         final_result = intermediate_results[-1]
 
-        total_time_ms = (time.time() - start_time) * 1000
+        total_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
 
         return ExecutionResult(
             algorithm_id=algorithm.algorithm_id,
@@ -251,6 +506,212 @@ class AlgorithmExecutor:
             metadata={
                 "algorithm_version": algorithm.version,
                 "algorithm_name": algorithm.name,
-                "parallel_searches": len(search_blocks),
+                "parallel_searches": (
+                    len(search_results) if num_searches is None else num_searches
+                ),
             },
         )
+
+    def _try_fuse_hybrid(
+        self,
+        blocks: Sequence[Block],
+        post_search_blocks: Sequence[Block],
+        query: str,
+        query_vector: Optional[List[float]],
+        context: Optional[Dict[str, Any]],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Build a single rrf retriever request for search blocks + RRF merge.
+
+        Applies when fusion is enabled, there are at least two search blocks
+        on the same index, and the first post-search block is an RRF merge.
+
+        Args:
+            blocks: Search blocks of the algorithm
+            post_search_blocks: Blocks following the search blocks
+            query: Search query text
+            query_vector: Optional pre-computed query embedding
+            context: Additional context
+
+        Returns:
+            Request body, or None if the algorithm does not match the pattern
+        """
+        if not self.fuse_hybrid_rrf or len(blocks) < 2 or not post_search_blocks:
+            return None
+
+        merge = post_search_blocks[0]
+        if not isinstance(merge, MergeBlock) or merge.config.get("strategy", "rrf") != "rrf":
+            return None
+
+        if not all(isinstance(b, (KeywordSearchBlock, VectorSearchBlock)) for b in blocks):
+            return None
+        if len({b.index for b in blocks}) != 1:
+            return None
+
+        retrievers = []
+        window = max_results = merge.config.get("max_results", 10)
+        for block in blocks:
+            body = block.build_body(query, query_vector, context)
+            window = max(window, body["size"])
+            if "knn" in body:
+                # RRF only uses ranks, so a per-retriever boost has no effect
+                knn = {k: v for k, v in body["knn"].items() if k != "boost"}
+                retrievers.append({"knn": knn})
+            else:
+                retrievers.append({"standard": {"query": body["query"]}})
+
+        return {
+            "retriever": {
+                "rrf": {
+                    "retrievers": retrievers,
+                    "rank_window_size": window,
+                    "rank_constant": merge.config.get("k", 60),
+                }
+            },
+            "size": max_results,
+        }
+
+    async def _execute_fused(
+        self, blocks: Sequence[SearchBlock], body: Dict[str, Any], query: str
+    ) -> BlockResult:
+        """Execute a fused rrf retriever request and parse it as a merge result."""
+        start_ns = time.perf_counter_ns()
+
+        response = await self.block_factory.es_client.search(index=blocks[0].index, body=body)
+
+        elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+
+        return self._parse_fused_response(blocks, response, elapsed_ms)
+
+    @staticmethod
+    def _parse_fused_response(
+        blocks: Sequence[SearchBlock], response: Dict[str, Any], took_ms: float
+    ) -> BlockResult:
+        """Parse an rrf retriever response as a merge result, raising if it failed."""
+        if "error" in response:
+            raise RuntimeError(f"Fused RRF search failed: {response['error']}")
+
+        hits = [
+            SearchResult(hit["_id"], hit["_score"], hit["_source"], hit["_index"], rank)
+            for rank, hit in enumerate(response["hits"]["hits"], start=1)
+        ]
+
+        return BlockResult(
+            hits=hits,
+            total=len(hits),
+            took_ms=took_ms,
+            metadata={
+                "block_type": "merge",
+                "strategy": "rrf",
+                "num_sources": len(blocks),
+                "fused": True,
+                "es_took_ms": response["took"],
+            },
+        )
+
+    async def _run_search_phase(
+        self,
+        blocks: Sequence[Block],
+        query: str,
+        query_vector: Optional[List[float]],
+        context: Optional[Dict[str, Any]],
+    ) -> List[BlockResult]:
+        """
+        Run the search-phase blocks of one algorithm concurrently.
+
+        Two or more SearchBlocks share a single _msearch request; every other
+        block (e.g. a registered plugin block) runs through its own execute()
+        at the same time.
+
+        Args:
+            blocks: Search-phase blocks of the algorithm
+            query: Search query text
+            query_vector: Optional pre-computed query embedding
+            context: Additional context
+
+        Returns:
+            One BlockResult per block, in the same order
+        """
+        use_msearch = sum(isinstance(block, SearchBlock) for block in blocks) > 1
+
+        batched = []
+        tasks = []
+        for block in blocks:
+            if use_msearch and isinstance(block, SearchBlock):
+                batched.append(block)
+            else:
+                tasks.append(
+                    block.execute(
+                        query=query,
+                        query_vector=query_vector,
+                        context=context,
+                        previous_results=None,
+                    )
+                )
+        if batched:
+            tasks.append(self._msearch(batched, query, query_vector, context))
+
+        outcomes = await asyncio.gather(*tasks)
+
+        # Put the results back in block order
+        batched_results = iter(outcomes[-1] if batched else ())
+        separate_results = iter(outcomes)
+        return [
+            (
+                next(batched_results)
+                if use_msearch and isinstance(block, SearchBlock)
+                else next(separate_results)
+            )
+            for block in blocks
+        ]
+
+    async def _msearch_bodies(self, searches: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Send header/body pairs as one _msearch request and return its responses."""
+        if not searches:
+            return []
+        response = await self.block_factory.es_client.msearch(searches=searches)
+        return response["responses"]
+
+    async def _msearch(
+        self,
+        blocks: Sequence[SearchBlock],
+        query: str,
+        query_vector: Optional[List[float]],
+        context: Optional[Dict[str, Any]],
+    ) -> List[BlockResult]:
+        """
+        Execute several search blocks as a single _msearch request.
+
+        Args:
+            blocks: Search blocks to execute
+            query: Search query text
+            query_vector: Optional pre-computed query embedding
+            context: Additional context
+
+        Returns:
+            One BlockResult per block, in the same order
+        """
+        start_ns = time.perf_counter_ns()
+
+        searches = []
+        for block in blocks:
+            searches.append({"index": block.index})
+            searches.append(block.build_body(query, query_vector, context))
+
+        responses = await self._msearch_bodies(searches)
+
+        elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+
+        return [
+            self._parse_msearch_response(block, block_response, query, elapsed_ms)
+            for block, block_response in zip(blocks, responses)
+        ]
+
+    @staticmethod
+    def _parse_msearch_response(
+        block: SearchBlock, block_response: Dict[str, Any], query: str, took_ms: float
+    ) -> BlockResult:
+        """Parse one entry of an _msearch response, raising if it failed."""
+        if "error" in block_response:
+            raise RuntimeError(f"{type(block).__name__} failed: {block_response['error']}")
+        return block.parse_response(block_response, query, took_ms)
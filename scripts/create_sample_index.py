@@ -13,6 +13,8 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import orjson
+
 from orchestrator.config import get_settings
 from orchestrator.core import ElasticsearchClient
 
@@ -126,6 +128,15 @@ SAMPLE_PRODUCTS = [
     },
 ]
 
+# _bulk request body, encoded once: an action line and a source line per product
+SAMPLE_BULK_BODY = b"".join(
+    orjson.dumps({"index": {"_index": SAMPLE_INDEX, "_id": product["id"]}})
+    + b"\n"
+    + orjson.dumps(product)
+    + b"\n"
+    for product in SAMPLE_PRODUCTS
+)
+
 
 async def create_sample_index():
     """Create sample index with test data."""
@@ -151,11 +162,13 @@ async def create_sample_index():
         print(f"  ✓ Index created")
         print()
 
-        # Index sample documents
+        # Index sample documents in a single pre-encoded bulk request
         print("Indexing sample products...")
-        for product in SAMPLE_PRODUCTS:
-            await es.index(index=SAMPLE_INDEX, id=product["id"], body=product)
-            print(f"  ✓ Indexed: {product['title']}")
+        result = await es.bulk(operations=SAMPLE_BULK_BODY)
+        if result["errors"]:
+            failed = [item["index"] for item in result["items"] if "error" in item["index"]]
+            raise RuntimeError(f"{len(failed)} documents failed to index: {failed[0]['error']}")
+        print(f"  ✓ Indexed {len(result['items'])} products")
 
         # Refresh index
         await es.indices.refresh(index=SAMPLE_INDEX)
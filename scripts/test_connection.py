@@ -50,8 +50,7 @@ async def test_connection():
 
         # Check health
         print("Health Check:")
-        is_healthy = await client.health_check()
-        health = await es.cluster.health()
+        is_healthy, health = await client.health_check()
         print(f"  Status: {health['status']}")
         print(f"  Nodes: {health['number_of_nodes']}")
         print(f"  Healthy: {'✓' if is_healthy else '✗'}")
@@ -0,0 +1,102 @@
+"""Shared fixtures for the orchestrator tests."""
+
+from typing import Any, Dict, List, Optional, Set
+
+import pytest
+
+from orchestrator.blocks import Block, BlockResult, SearchResult
+from orchestrator.config import AlgorithmConfig, BlockType
+from orchestrator.core import AlgorithmExecutor, BlockFactory
+
+INDEX = "products"
+
+
+class FakeElasticsearch:
+    """Stand-in for AsyncElasticsearch that records requests and returns canned hits."""
+
+    def __init__(self):
+        self.requests: List[tuple] = []
+        # _msearch entries for these indices come back as errors
+        self.failing_indices: Set[str] = set()
+
+    @staticmethod
+    def response_for(body: Dict[str, Any]) -> Dict[str, Any]:
+        """Hits for a request body: docs 1..size, or 6..size+5 for kNN searches."""
+        start = 6 if "knn" in body else 1
+        hits = [
+            {
+                "_id": str(doc),
+                "_score": 10.0 - rank,
+                "_source": {"title": f"doc {doc}"},
+                "_index": INDEX,
+            }
+            for rank, doc in enumerate(range(start, start + body.get("size", 10)))
+        ]
+        return {"took": 1, "hits": {"total": {"value": len(hits)}, "hits": hits}}
+
+    async def search(self, index: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        self.requests.append(("search", index, body))
+        return self.response_for(body)
+
+    async def msearch(self, searches: List[Dict[str, Any]]) -> Dict[str, Any]:
+        self.requests.append(("msearch", None, searches))
+        responses = [
+            (
+                {"error": {"type": "index_not_found_exception"}, "status": 404}
+                if header["index"] in self.failing_indices
+                else self.response_for(body)
+            )
+            for header, body in zip(searches[::2], searches[1::2])
+        ]
+        return {"took": 1, "responses": responses}
+
+
+class StaticBlock(Block):
+    """Plugin search block returning the configured document IDs, without ElasticSearch."""
+
+    async def execute(
+        self,
+        query: str,
+        query_vector: Optional[List[float]] = None,
+        context: Optional[Dict[str, Any]] = None,
+        previous_results: Optional[List[BlockResult]] = None,
+    ) -> BlockResult:
+        hits = [
+            SearchResult(doc_id, 1.0 / rank, {}, rank=rank)
+            for rank, doc_id in enumerate(self.config["ids"], start=1)
+        ]
+        return BlockResult(hits=hits, total=len(hits), metadata={"block_type": "static"})
+
+
+def make_algorithm(*components: Dict[str, Any], algorithm_id: str = "test") -> AlgorithmConfig:
+    """Build a validated algorithm from component dicts."""
+    return AlgorithmConfig(algorithm_id=algorithm_id, name=algorithm_id, components=components)
+
+
+KEYWORD = {"type": "keyword_search", "config": {"fields": ["title"], "size": 5}}
+VECTOR = {"type": "vector_search", "config": {"field": "embedding", "k": 5}}
+RRF_MERGE = {"type": "merge", "config": {"strategy": "rrf", "max_results": 5}}
+STATIC = {"type": "hybrid_search", "config": {"ids": ["3", "42", "7"]}}
+
+
+@pytest.fixture
+def es() -> FakeElasticsearch:
+    return FakeElasticsearch()
+
+
+@pytest.fixture
+def executor(es: FakeElasticsearch) -> AlgorithmExecutor:
+    return AlgorithmExecutor(BlockFactory(es, INDEX))
+
+
+@pytest.fixture
+def static_block():
+    """Register StaticBlock as the hybrid_search block for the duration of a test."""
+    registry = BlockFactory._registry()
+    previous = registry.get(BlockType.HYBRID_SEARCH)
+    BlockFactory.register(BlockType.HYBRID_SEARCH, StaticBlock, needs_es=False)
+    yield StaticBlock
+    if previous is None:
+        del registry[BlockType.HYBRID_SEARCH]
+    else:
+        registry[BlockType.HYBRID_SEARCH] = previous
@@ -0,0 +1,190 @@
+"""Tests for the API routes, against a fake ElasticSearch client."""
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from orchestrator.api import routes
+from orchestrator.api.main import create_app
+from orchestrator.api.models import CompareResponse, SearchResponse
+from orchestrator.config import Settings, get_settings
+
+ALGORITHMS = Path(__file__).resolve().parent.parent / "configs" / "algorithms"
+
+
+class FakeClientWrapper:
+    """Stand-in for ElasticsearchClient around a FakeElasticsearch."""
+
+    def __init__(self, es):
+        self.es = es
+
+    async def get_client(self):
+        return self.es
+
+    async def health_check(self):
+        return True, {"status": "green"}
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    for config_file in ALGORITHMS.glob("*.json"):
+        shutil.copy(config_file, tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def client(config_dir, es, monkeypatch):
+    monkeypatch.setattr(routes, "_algorithm_cache", {})
+    monkeypatch.setattr(routes, "_algorithm_list_cache", None)
+    monkeypatch.setattr(routes, "_executor_cache", {})
+
+    app = create_app()
+    settings = Settings(algorithm_config_path=str(config_dir))
+    app.dependency_overrides[get_settings] = lambda: settings
+    app.dependency_overrides[routes.get_es_client] = lambda: FakeClientWrapper(es)
+    return TestClient(app)
+
+
+def touch(path: Path) -> None:
+    """Move a file's mtime forward so the change is visible at any timestamp resolution."""
+    mtime_ns = path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+
+def ids(response):
+    return [algorithm["algorithm_id"] for algorithm in response.json()]
+
+
+def test_list_algorithms_etag_round_trip(client, config_dir):
+    first = client.get("/api/v1/algorithms")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert ids(first) == sorted(path.stem for path in ALGORITHMS.glob("*.json"))
+
+    cached = client.get("/api/v1/algorithms", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == etag
+    assert cached.content == b""
+
+    for if_none_match in (f'"other", {etag}', f"W/{etag}", "*"):
+        listed = client.get("/api/v1/algorithms", headers={"If-None-Match": if_none_match})
+        assert listed.status_code == 304, if_none_match
+
+    stale = client.get("/api/v1/algorithms", headers={"If-None-Match": 'W/"other"'})
+    assert stale.status_code == 200
+
+    touch(config_dir / "keyword-only.json")
+    modified = client.get("/api/v1/algorithms", headers={"If-None-Match": etag})
+    assert modified.status_code == 200
+    assert modified.headers["ETag"] != etag
+    assert ids(modified) == ids(first)
+
+    shutil.copy(config_dir / "keyword-only.json", config_dir / "keyword-copy.json")
+    added = client.get("/api/v1/algorithms", headers={"If-None-Match": modified.headers["ETag"]})
+    assert added.status_code == 200
+    assert len(added.json()) == len(first.json()) + 1
+
+
+def test_saved_algorithm_is_listed(client):
+    etag = client.get("/api/v1/algorithms").headers["ETag"]
+    algorithm = {**client.get("/api/v1/algorithms/keyword-only").json(), "algorithm_id": "new"}
+
+    assert client.post("/api/v1/algorithms", json=algorithm).status_code == 201
+
+    listed = client.get("/api/v1/algorithms", headers={"If-None-Match": etag})
+    assert listed.status_code == 200
+    assert "new" in ids(listed)
+
+
+def test_list_algorithms_skips_deleted_file(client, monkeypatch):
+    expected = sorted(path.stem for path in ALGORITHMS.glob("*.json"))
+    glob = Path.glob
+    # The file disappears between the directory listing and stat()
+    monkeypatch.setattr(
+        Path, "glob", lambda self, pattern: [*glob(self, pattern), self / "deleted.json"]
+    )
+
+    response = client.get("/api/v1/algorithms")
+
+    assert response.status_code == 200
+    assert ids(response) == expected
+
+async def test_load_algorithm_reparses_changed_file(config_dir, monkeypatch):
+    monkeypatch.setattr(routes, "_algorithm_cache", {})
+    settings = Settings(algorithm_config_path=str(config_dir))
+
+    first = await routes.load_algorithm("keyword-only", settings)
+    assert await routes.load_algorithm("keyword-only", settings) is first
+
+    touch(config_dir / "keyword-only.json")
+    reloaded = await routes.load_algorithm("keyword-only", settings)
+    assert reloaded is not first
+    assert reloaded.components == first.components
+
+    (config_dir / "keyword-only.json").unlink()
+    assert await routes.load_algorithm("keyword-only", settings) is None
+    assert "keyword-only" not in routes._algorithm_cache
+
+
+@pytest.mark.parametrize("parallel", [True, False])
+def test_search(client, parallel):
+    response = client.post(
+        "/api/v1/search",
+        json={"query": "shoes", "algorithm_id": "keyword-only", "parallel": parallel},
+    )
+
+    assert response.status_code == 200
+    body = SearchResponse.model_validate(response.json())
+    assert body.algorithm_id == "keyword-only"
+    assert [hit.rank for hit in body.hits] == list(range(1, len(body.hits) + 1))
+    assert body.hits[0].id == "1"
+
+
+
+def test_compare_batches_searches(client, es):
+    response = client.post(
+        "/api/v1/compare",
+        json={
+            "query": "shoes",
+            "query_vector": [0.1, 0.2, 0.3],
+            "algorithm_ids": ["keyword-only", "hybrid-rrf", "missing"],
+        },
+    )
+
+    assert response.status_code == 200
+    body = CompareResponse.model_validate(response.json())
+    assert [r.algorithm_id for r in body.results] == ["keyword-only", "hybrid-rrf"]
+    assert body.comparison_metadata == {"num_algorithms": 3, "successful": 2, "failed": 1}
+    assert [kind for kind, *_ in es.requests] == ["msearch"]
+
+async def test_executor_cache_is_bounded(es, monkeypatch):
+    monkeypatch.setattr(routes, "_executor_cache", {})
+    wrapper = FakeClientWrapper(es)
+    settings = Settings()
+
+    first = await routes._get_executor(wrapper, settings, "index-0")
+    assert await routes._get_executor(wrapper, settings, "index-0") is first
+
+    for i in range(routes.MAX_CACHED_EXECUTORS + 10):
+        await routes._get_executor(wrapper, settings, f"index-{i}")
+        assert len(routes._executor_cache) <= routes.MAX_CACHED_EXECUTORS
+
+    # A replacement client gets a fresh executor even for a cached key
+    other = FakeClientWrapper(type(es)())
+    replaced = await routes._get_executor(other, settings, "index-0")
+    assert replaced.block_factory.es_client is other.es
+
+
+def test_search_errors(client):
+    missing = client.post("/api/v1/search", json={"query": "q", "algorithm_id": "missing"})
+    assert missing.status_code == 404
+
+    invalid = client.post("/api/v1/search", json={"query": "q", "algorithm_config": {}})
+    assert invalid.status_code == 400
+
+    malformed = client.post("/api/v1/search", content=b'{"query": ')
+    assert malformed.status_code == 422
@@ -0,0 +1,33 @@
+"""Tests for BlockFactory."""
+
+import pytest
+
+from conftest import INDEX, StaticBlock
+from orchestrator.blocks import KeywordSearchBlock
+from orchestrator.config import BlockType
+from orchestrator.core import BlockFactory
+
+
+@pytest.fixture
+def factory(es):
+    return BlockFactory(es, INDEX)
+
+
+def test_search_blocks_get_client_and_index(factory, es):
+    default = factory.create_block(BlockType.KEYWORD_SEARCH, {"fields": ["title"]})
+    override = factory.create_block(BlockType.KEYWORD_SEARCH, {"index": "other"})
+
+    assert isinstance(default, KeywordSearchBlock)
+    assert (default.es_client, default.index) == (es, INDEX)
+    assert override.index == "other"
+
+
+def test_unknown_block_type(factory):
+    with pytest.raises(ValueError, match="Unknown block type"):
+        factory.create_block(BlockType.FILTER, {})
+
+
+def test_register_block(factory, static_block):
+    block = factory.create_block(BlockType.HYBRID_SEARCH, {"ids": ["1"]})
+
+    assert isinstance(block, StaticBlock)
@@ -0,0 +1,225 @@
+"""Tests for AlgorithmExecutor."""
+
+import pytest
+
+from conftest import KEYWORD, RRF_MERGE, STATIC, VECTOR, make_algorithm
+from orchestrator.core import AlgorithmExecutor, BlockFactory
+
+VEC = [0.1, 0.2, 0.3]
+
+
+def hit_ids(result):
+    return [hit.id for hit in result.final_result.hits]
+
+
+async def test_registered_block_runs_in_parallel_path(executor, es, static_block):
+    algorithm = make_algorithm(KEYWORD, VECTOR, STATIC, RRF_MERGE)
+
+    result = await executor.execute_parallel_searches(algorithm, "q", VEC)
+
+    # The two SearchBlocks share one _msearch; the plugin block runs on its own
+    assert [kind for kind, *_ in es.requests] == ["msearch"]
+    assert [r.metadata["block_type"] for r in result.intermediate_results] == [
+        "keyword_search",
+        "vector_search",
+        "static",
+        "merge",
+    ]
+    assert [hit.id for hit in result.intermediate_results[2].hits] == ["3", "42", "7"]
+    # Doc 3 is found by both the keyword and the plugin block
+    assert hit_ids(result)[0] == "3"
+
+
+async def test_registered_block_runs_in_batch(executor, es, static_block):
+    with_plugin = make_algorithm(KEYWORD, STATIC, RRF_MERGE, algorithm_id="with-plugin")
+    plugin_only = make_algorithm(STATIC, algorithm_id="plugin-only")
+    keyword_only = make_algorithm(KEYWORD, algorithm_id="keyword-only")
+
+    outcomes = await executor.execute_batch([with_plugin, plugin_only, keyword_only], "q", VEC)
+
+    assert not [o for o in outcomes if isinstance(o, Exception)], outcomes
+    assert [kind for kind, *_ in es.requests] == ["msearch"]
+    assert len(es.requests[0][2]) == 4  # header + body for each keyword block
+    assert hit_ids(outcomes[1]) == ["3", "42", "7"]
+    assert hit_ids(outcomes[2]) == ["1", "2", "3", "4", "5"]
+    assert hit_ids(outcomes[0])[0] == "3"
+
+
+async def test_batch_matches_parallel_path_with_registered_block(executor, static_block):
+    algorithms = [
+        make_algorithm(KEYWORD, STATIC, RRF_MERGE, algorithm_id="a"),
+        make_algorithm(KEYWORD, VECTOR, RRF_MERGE, algorithm_id="b"),
+    ]
+
+    batched = await executor.execute_batch(algorithms, "q", VEC)
+    single = [await executor.execute_parallel_searches(a, "q", VEC) for a in algorithms]
+
+    for batch_result, single_result in zip(batched, single):
+        assert [(h.id, h.rank, h.score) for h in batch_result.final_result.hits] == [
+            (h.id, h.rank, h.score) for h in single_result.final_result.hits
+        ]
+
+
+async def test_parallel_searches_share_one_msearch(executor, es):
+    algorithm = make_algorithm(KEYWORD, VECTOR, RRF_MERGE)
+
+    result = await executor.execute_parallel_searches(algorithm, "q", VEC)
+
+    assert [kind for kind, *_ in es.requests] == ["msearch"]
+    assert result.metadata["parallel_searches"] == 2
+    assert [hit.rank for hit in result.final_result.hits] == [1, 2, 3, 4, 5]
+
+
+async def test_single_search_block_uses_plain_search(executor, es):
+    result = await executor.execute_parallel_searches(make_algorithm(KEYWORD), "q")
+
+    assert [kind for kind, *_ in es.requests] == ["search"]
+    assert hit_ids(result) == ["1", "2", "3", "4", "5"]
+
+
+async def test_msearch_error_entry_raises(executor, es):
+    es.failing_indices.add("other")
+    other = {**VECTOR, "config": {**VECTOR["config"], "index": "other"}}
+    algorithm = make_algorithm(KEYWORD, other)
+
+    with pytest.raises(RuntimeError, match="VectorSearchBlock failed"):
+        await executor.execute_parallel_searches(algorithm, "q", VEC)
+
+
+async def test_batch_isolates_failures(executor, es):
+    es.failing_indices.add("other")
+    algorithms = [
+        make_algorithm(KEYWORD, algorithm_id="ok"),
+        make_algorithm({**KEYWORD, "config": {**KEYWORD["config"], "index": "other"}}),
+        make_algorithm({**KEYWORD, "enabled": False}, algorithm_id="empty"),
+        make_algorithm(KEYWORD, VECTOR, RRF_MERGE, algorithm_id="hybrid"),
+    ]
+
+    outcomes = await executor.execute_batch(algorithms, "q", VEC)
+
+    assert hit_ids(outcomes[0]) == ["1", "2", "3", "4", "5"]
+    assert isinstance(outcomes[1], RuntimeError)
+    assert isinstance(outcomes[2], ValueError)
+    assert hit_ids(outcomes[3]) == ["1", "6", "2", "7", "3"]
+    assert [kind for kind, *_ in es.requests] == ["msearch"]
+
+
+async def test_batch_msearch_failure_fails_only_its_algorithms(executor, es, static_block):
+    async def broken_msearch(searches):
+        raise ConnectionError("cluster unavailable")
+
+    es.msearch = broken_msearch
+    algorithms = [make_algorithm(KEYWORD, algorithm_id="es"), make_algorithm(STATIC)]
+
+    outcomes = await executor.execute_batch(algorithms, "q")
+
+    assert isinstance(outcomes[0], ConnectionError)
+    assert hit_ids(outcomes[1]) == ["3", "42", "7"]
+
+
+async def test_fused_rrf_sends_one_retriever_request(es):
+    executor = AlgorithmExecutor(BlockFactory(es, "products"), fuse_hybrid_rrf=True)
+    algorithm = make_algorithm(KEYWORD, VECTOR, RRF_MERGE)
+
+    result = await executor.execute_parallel_searches(algorithm, "q", VEC)
+
+    [(kind, index, body)] = es.requests
+    assert (kind, index) == ("search", "products")
+    rrf = body["retriever"]["rrf"]
+    assert [list(r) for r in rrf["retrievers"]] == [["standard"], ["knn"]]
+    assert (rrf["rank_window_size"], rrf["rank_constant"], body["size"]) == (5, 60, 5)
+    assert result.final_result.metadata["fused"] is True
+    assert result.metadata["parallel_searches"] == 2
+
+
+async def test_fused_rrf_skipped_across_indices(es):
+    executor = AlgorithmExecutor(BlockFactory(es, "products"), fuse_hybrid_rrf=True)
+    other = {**VECTOR, "config": {**VECTOR["config"], "index": "other"}}
+
+    await executor.execute_parallel_searches(make_algorithm(KEYWORD, other, RRF_MERGE), "q", VEC)
+
+    assert [kind for kind, *_ in es.requests] == ["msearch"]
+
+
+async def test_sequential_and_parallel_agree(executor):
+    algorithm = make_algorithm(KEYWORD, VECTOR, RRF_MERGE)
+
+    sequential = await executor.execute(algorithm, "q", VEC)
+    parallel = await executor.execute_parallel_searches(algorithm, "q", VEC)
+
+    # Sequential execution only merges the first search result
+    assert hit_ids(sequential) == ["1", "2", "3", "4", "5"]
+    assert hit_ids(parallel) == ["1", "6", "2", "7", "3"]
+
+
+async def test_search_after_merge_only_runs_sequentially(executor):
+    algorithm = make_algorithm(KEYWORD, RRF_MERGE, VECTOR)
+
+    result = await executor.execute(algorithm, "q", VEC)
+    assert len(result.intermediate_results) == 3
+
+    with pytest.raises(ValueError, match="must come before"):
+        await executor.execute_parallel_searches(algorithm, "q", VEC)
+
+
+def test_plan_is_reused_until_components_change(executor):
+    algorithm = make_algorithm(KEYWORD, VECTOR, RRF_MERGE)
+
+    plan = executor._get_plan(algorithm)
+    assert executor._get_plan(algorithm) is plan
+
+    # Same id and version, edited components
+    edited = make_algorithm(KEYWORD, RRF_MERGE)
+    edited_plan = executor._get_plan(edited)
+    assert edited_plan is not plan
+    assert len(edited_plan.search_blocks) == 1
+
+
+async def test_no_enabled_components(executor):
+    algorithm = make_algorithm({**KEYWORD, "enabled": False})
+
+    with pytest.raises(ValueError, match="No enabled components"):
+        await executor.execute(algorithm, "q")
+
+
+async def test_copied_algorithm_runs_its_own_components(executor):
+    algorithm = make_algorithm(KEYWORD, VECTOR, RRF_MERGE)
+    await executor.execute_parallel_searches(algorithm, "q", VEC)
+
+    copy = algorithm.model_copy(update={"components": algorithm.components[:1]})
+    result = await executor.execute_parallel_searches(copy, "q", VEC)
+
+    assert [r.metadata["block_type"] for r in result.intermediate_results] == ["keyword_search"]
+
+
+async def test_batch_fuses_like_parallel_path(es, static_block):
+    executor = AlgorithmExecutor(BlockFactory(es, "products"), fuse_hybrid_rrf=True)
+    hybrid = make_algorithm(KEYWORD, VECTOR, RRF_MERGE, algorithm_id="hybrid")
+    algorithms = [hybrid, make_algorithm(KEYWORD, algorithm_id="keyword"), make_algorithm(STATIC)]
+
+    outcomes = await executor.execute_batch(algorithms, "q", VEC)
+    single = await executor.execute_parallel_searches(hybrid, "q", VEC)
+
+    [(_, _, searches), (_, _, fused_body)] = es.requests
+    assert searches[1] == fused_body
+    assert len(searches) == 4
+    assert outcomes[0].final_result.metadata["fused"] is True
+    assert outcomes[0].metadata["parallel_searches"] == 2
+    assert hit_ids(outcomes[0]) == hit_ids(single)
+    assert hit_ids(outcomes[1]) == ["1", "2", "3", "4", "5"]
+    assert hit_ids(outcomes[2]) == ["3", "42", "7"]
+
+
+async def test_batch_fused_error_entry_fails_its_algorithm(es):
+    es.failing_indices.add("other")
+    executor = AlgorithmExecutor(BlockFactory(es, "products"), fuse_hybrid_rrf=True)
+    other = [{**c, "config": {**c["config"], "index": "other"}} for c in (KEYWORD, VECTOR)]
+    algorithms = [
+        make_algorithm(*other, RRF_MERGE, algorithm_id="fused"),
+        make_algorithm(KEYWORD, algorithm_id="keyword"),
+    ]
+
+    outcomes = await executor.execute_batch(algorithms, "q", VEC)
+
+    assert isinstance(outcomes[0], RuntimeError)
+    assert hit_ids(outcomes[1]) == ["1", "2", "3", "4", "5"]
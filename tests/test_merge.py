@@ -0,0 +1,160 @@
+"""Tests for MergeBlock, checked against the original merge implementation."""
+
+import random
+from collections import defaultdict
+
+import pytest
+
+from orchestrator.blocks import BlockResult, MergeBlock, SearchResult
+
+
+def reference_merge(config, results):
+    """The original (pre-optimization) merge strategies, kept as the expected behavior."""
+    strategy = config.get("strategy", "rrf")
+    merged = []
+
+    if strategy in ("rrf", "weighted"):
+        scores = defaultdict(float)
+        doc_map = {}
+        for idx, result_set in enumerate(results):
+            weight = config.get("weights", {}).get(str(idx), 1.0)
+            for hit in result_set.hits:
+                if strategy == "rrf":
+                    if hit.rank is None:
+                        continue
+                    scores[hit.id] += 1.0 / (config.get("k", 60) + hit.rank)
+                else:
+                    scores[hit.id] += hit.score * weight
+                doc_map.setdefault(hit.id, hit)
+        for idx, (doc_id, score) in enumerate(
+            sorted(scores.items(), key=lambda x: x[1], reverse=True)
+        ):
+            merged.append((doc_id, idx + 1, score))
+    elif strategy == "concatenate":
+        for result_set in results:
+            for hit in result_set.hits:
+                merged.append((hit.id, len(merged) + 1, hit.score))
+    elif strategy == "interleave":
+        seen = set()
+        for i in range(max(len(r.hits) for r in results)):
+            for result_set in results:
+                if i < len(result_set.hits) and result_set.hits[i].id not in seen:
+                    hit = result_set.hits[i]
+                    seen.add(hit.id)
+                    merged.append((hit.id, len(merged) + 1, hit.score))
+
+    return merged[: config.get("max_results", 10)]
+
+
+def random_results(rng):
+    """Between one and four result sets with overlapping IDs and tied scores."""
+    results = []
+    for _ in range(rng.randint(1, 4)):
+        doc_ids = rng.sample(range(60), rng.randint(0, 40))
+        hits = [
+            SearchResult(
+                str(doc_id),
+                float(rng.choice([1, 2, 3, rng.random()])),
+                {},
+                rank=None if rng.random() < 0.05 else rank,
+            )
+            for rank, doc_id in enumerate(doc_ids, start=1)
+        ]
+        results.append(BlockResult(hits=hits, total=len(hits)))
+    return results
+
+
+def result_set(*doc_ids, scores=None):
+    hits = [
+        SearchResult(doc_id, scores[i] if scores else 1.0, {}, rank=i + 1)
+        for i, doc_id in enumerate(doc_ids)
+    ]
+    return BlockResult(hits=hits, total=len(hits))
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {"strategy": "rrf", "max_results": 15},
+        {"strategy": "rrf", "k": 1, "max_results": 100},
+        {"strategy": "weighted", "weights": {"0": 0.3, "1": 2}, "max_results": 25},
+        {"strategy": "concatenate", "max_results": 30},
+        {"strategy": "interleave", "max_results": 12},
+    ],
+)
+async def test_matches_reference_implementation(config):
+    for seed in range(200):
+        expected = reference_merge(config, random_results(random.Random(seed)))
+
+        previous_results = random_results(random.Random(seed))
+        result = await MergeBlock(config).execute("q", previous_results=previous_results)
+
+        actual = [(hit.id, hit.rank, hit.score) for hit in result.hits]
+        assert [(i, r) for i, r, _ in actual] == [(i, r) for i, r, _ in expected], seed
+        assert [s for *_, s in actual] == pytest.approx([s for *_, s in expected]), seed
+        assert result.total == len(expected)
+
+
+async def test_rrf_scores():
+    block = MergeBlock({"strategy": "rrf", "k": 60})
+
+    result = await block.execute("q", previous_results=[result_set("a", "b"), result_set("b", "c")])
+
+    assert [hit.id for hit in result.hits] == ["b", "a", "c"]
+    assert result.hits[0].score == pytest.approx(1 / 62 + 1 / 61)
+    assert [hit.rank for hit in result.hits] == [1, 2, 3]
+    assert result.metadata == {"block_type": "merge", "strategy": "rrf", "num_sources": 2}
+
+
+async def test_weighted_scores_and_ties_keep_first_seen_order():
+    block = MergeBlock({"strategy": "weighted", "weights": {"1": 2.0}})
+
+    result = await block.execute(
+        "q",
+        previous_results=[
+            result_set("a", "b", scores=[2.0, 1.0]),
+            result_set("c", "d", scores=[1.0, 0.5]),
+        ],
+    )
+
+    assert [(hit.id, hit.score) for hit in result.hits] == [
+        ("a", 2.0),
+        ("c", 2.0),
+        ("b", 1.0),
+        ("d", 1.0),
+    ]
+
+
+async def test_max_results_limits_output():
+    block = MergeBlock({"strategy": "rrf", "max_results": 2})
+
+    result = await block.execute("q", previous_results=[result_set("a", "b", "c")])
+
+    assert [hit.id for hit in result.hits] == ["a", "b"]
+    assert result.total == 2
+
+
+async def test_requires_previous_results():
+    with pytest.raises(ValueError, match="previous_results is required"):
+        await MergeBlock({}).execute("q", previous_results=[])
+
+
+async def test_interleave_skips_duplicates_and_uneven_lengths():
+    block = MergeBlock({"strategy": "interleave"})
+
+    result = await block.execute(
+        "q", previous_results=[result_set("a", "b", "c", "d"), result_set("b", "e")]
+    )
+
+    assert [(hit.id, hit.rank) for hit in result.hits] == [
+        ("a", 1),
+        ("b", 2),
+        ("e", 3),
+        ("c", 4),
+        ("d", 5),
+    ]
+
+
+def test_unknown_strategy_is_rejected():
+    with pytest.raises(ValueError, match="Unknown merge strategy"):
+        MergeBlock({"strategy": "median"})